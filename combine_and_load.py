@@ -1,63 +1,137 @@
 import os
 from pathlib import Path
-import pandas as pd
 import duckdb
 
+# Column types of the CSVs written by extract_votes.py. Declaring them lets
+# DuckDB parse each file directly instead of sniffing a sample for types.
+SUMMARY_COLUMNS = {
+    'item_number': 'INTEGER',
+    'motion_number': 'INTEGER',
+    'motion_title': 'VARCHAR',
+    'motion_type': 'VARCHAR',
+    'legistar_number': 'VARCHAR',
+    'legistar_link': 'VARCHAR',
+    'description': 'VARCHAR',
+    'is_unanimous': 'BOOLEAN',
+    'total_ayes': 'INTEGER',
+    'total_noes': 'INTEGER',
+    'total_abstentions': 'INTEGER',
+    'total_excused': 'INTEGER',
+    'total_recused': 'INTEGER',
+    'total_non_voting': 'INTEGER',
+    'page_number': 'INTEGER',
+}
 
-def load_alders_to_db():
-    """Load alders dimension table from alders.csv into DuckDB."""
+DETAILED_COLUMNS = {
+    'date': 'DATE',
+    'item_number': 'INTEGER',
+    'motion_number': 'INTEGER',
+    'motion_type': 'VARCHAR',
+    'legistar_number': 'VARCHAR',
+    'member_name': 'VARCHAR',
+    'vote_type': 'VARCHAR',
+    'is_unanimous': 'BOOLEAN',
+}
+
+# SELECTs shared by the full and incremental vote loads. The single parameter
+# is the list of Parquet staging files to read (see convert_csv_to_parquet).
+# Summary files carry no date column, so it is taken from the filename
+# (format: YYYY-MM-DD_votes_summary.parquet). Rows are
+# sorted on the votes_with_voters join keys so the per-row-group min/max zone
+# maps can prune during joins and date range queries.
+SUMMARY_SELECT = r"""
+    SELECT 
+        CAST(regexp_extract(filename, '(\d+-\d+-\d+)_votes_summary\.parquet$', 1) AS DATE) AS meeting_date,
+        CAST(item_number AS INTEGER) AS item_number,
+        CAST(motion_number AS INTEGER) AS motion_number,
+        CAST(motion_title AS VARCHAR) AS motion_title,
+        CAST(motion_type AS VARCHAR) AS motion_type,
+        CAST(legistar_number AS VARCHAR) AS legistar_number,
+        CAST(legistar_link AS VARCHAR) AS legistar_link,
+        CAST(description AS VARCHAR) AS description,
+        CAST(is_unanimous AS BOOLEAN) AS is_unanimous,
+        CAST(total_ayes AS INTEGER) AS total_ayes,
+        CAST(total_noes AS INTEGER) AS total_noes,
+        CAST(total_abstentions AS INTEGER) AS total_abstentions,
+        CAST(total_excused AS INTEGER) AS total_excused,
+        CAST(total_recused AS INTEGER) AS total_recused,
+        CAST(total_non_voting AS INTEGER) AS total_non_voting,
+        CAST(page_number AS INTEGER) AS page_number
+    FROM read_parquet(?, filename=true, union_by_name=true)
+    ORDER BY meeting_date, item_number, motion_number
+"""
+
+DETAILED_SELECT = """
+    SELECT 
+        CAST(date AS DATE) AS meeting_date,
+        CAST(item_number AS INTEGER) AS item_number,
+        CAST(motion_number AS INTEGER) AS motion_number,
+        CAST(motion_type AS VARCHAR) AS motion_type,
+        CAST(legistar_number AS VARCHAR) AS legistar_number,
+        CAST(member_name AS VARCHAR) AS member_name,
+        CAST(vote_type AS VARCHAR) AS vote_type,
+        CAST(is_unanimous AS BOOLEAN) AS is_unanimous
+    FROM read_parquet(?, union_by_name=true)
+    ORDER BY meeting_date, item_number, motion_number, member_name
+"""
+
+
+def rollback(db):
+    """Roll back the open transaction, if there is one.
+
+    Called from error handlers, where the failure may have happened before
+    BEGIN or after COMMIT; a failed ROLLBACK must not hide the original error.
+    """
+    try:
+        db.execute("ROLLBACK")
+    except duckdb.Error:
+        pass  # No transaction was open
+
+
+def load_alders_to_db(db=None):
+    """Load alders dimension table from alders.csv into DuckDB.
+
+    Uses the given connection if one is passed in, otherwise opens (and
+    closes) its own connection to madison_votes.db.
+    """
     alders_file = Path("alders.csv")
     if not alders_file.exists():
         print("No alders.csv found - run fetch_alders.py first")
         return False
 
     print("Loading alders dimension table...")
-    alders_df = pd.read_csv(alders_file)
 
-    db = duckdb.connect('madison_votes.db')
+    owns_connection = db is None
+    if owns_connection:
+        db = duckdb.connect('madison_votes.db')
     try:
-        db.execute("""
-            CREATE OR REPLACE TABLE alders (
-                person_id INTEGER,
-                full_name VARCHAR,
-                first_name VARCHAR,
-                last_name VARCHAR,
-                district INTEGER,
-                member_type VARCHAR,
-                start_date DATE,
-                end_date DATE,
-                email VARCHAR,
-                extra_text VARCHAR,
-                address VARCHAR,
-                city VARCHAR,
-                state VARCHAR,
-                zip VARCHAR,
-                phone VARCHAR,
-                website VARCHAR
-            )
-        """)
+        # Load everything in one transaction so a failure leaves the
+        # previous alder tables and views in place
+        db.execute("BEGIN TRANSACTION")
 
-        db.register('alders_df', alders_df)
-        db.execute("""
-            INSERT INTO alders
+        # Sorted by name and term so the votes_with_alder_info range join
+        # can skip row groups via zone maps
+        db.execute(f"""
+            CREATE OR REPLACE TABLE alders AS
             SELECT
-                person_id,
-                full_name,
-                first_name,
-                last_name,
-                district,
-                member_type,
-                CAST(start_date AS DATE),
-                CAST(end_date AS DATE),
-                email,
-                extra_text,
-                address,
-                city,
-                state,
-                zip,
-                phone,
-                website
-            FROM alders_df
+                CAST(person_id AS INTEGER) AS person_id,
+                CAST(full_name AS VARCHAR) AS full_name,
+                CAST(first_name AS VARCHAR) AS first_name,
+                CAST(last_name AS VARCHAR) AS last_name,
+                CAST(district AS INTEGER) AS district,
+                CAST(member_type AS VARCHAR) AS member_type,
+                CAST(start_date AS DATE) AS start_date,
+                CAST(end_date AS DATE) AS end_date,
+                CAST(email AS VARCHAR) AS email,
+                CAST(extra_text AS VARCHAR) AS extra_text,
+                CAST(address AS VARCHAR) AS address,
+                CAST(city AS VARCHAR) AS city,
+                CAST(state AS VARCHAR) AS state,
+                CAST(zip AS VARCHAR) AS zip,
+                CAST(phone AS VARCHAR) AS phone,
+                CAST(website AS VARCHAR) AS website
+            FROM read_csv_auto('{alders_file}')
+            ORDER BY full_name, start_date
         """)
 
         alder_count = db.execute("SELECT COUNT(*) FROM alders").fetchone()[0]
@@ -105,32 +179,18 @@ def load_alders_to_db():
         committees_file = Path("alder_committees.csv")
         if committees_file.exists():
             print("\nLoading alder committees...")
-            committees_df = pd.read_csv(committees_file)
 
-            db.execute("""
-                CREATE OR REPLACE TABLE alder_committees (
-                    person_id INTEGER,
-                    body_id INTEGER,
-                    body_name VARCHAR,
-                    member_type VARCHAR,
-                    title VARCHAR,
-                    start_date DATE,
-                    end_date DATE
-                )
-            """)
-
-            db.register('committees_df', committees_df)
-            db.execute("""
-                INSERT INTO alder_committees
+            db.execute(f"""
+                CREATE OR REPLACE TABLE alder_committees AS
                 SELECT
-                    person_id,
-                    body_id,
-                    body_name,
-                    member_type,
-                    title,
-                    CAST(start_date AS DATE),
-                    CAST(end_date AS DATE)
-                FROM committees_df
+                    CAST(person_id AS INTEGER) AS person_id,
+                    CAST(body_id AS INTEGER) AS body_id,
+                    CAST(body_name AS VARCHAR) AS body_name,
+                    CAST(member_type AS VARCHAR) AS member_type,
+                    CAST(title AS VARCHAR) AS title,
+                    CAST(start_date AS DATE) AS start_date,
+                    CAST(end_date AS DATE) AS end_date
+                FROM read_csv_auto('{committees_file}')
             """)
 
             committee_count = db.execute("SELECT COUNT(*) FROM alder_committees").fetchone()[0]
@@ -156,65 +216,75 @@ def load_alders_to_db():
 
             print("Created current_committee_assignments view")
 
+        db.execute("COMMIT")
         return True
 
     except Exception as e:
         print(f"Error loading alders data: {e}")
+        rollback(db)
         return False
     finally:
-        db.close()
+        if owns_connection:
+            db.close()
 
 
-def combine_and_load_to_db():
-    """Combine all CSV files and load them into DuckDB."""
+def convert_csv_to_parquet(db, csv_files, columns):
+    """Return Parquet copies of the given CSVs in a parquet/ subfolder.
+
+    A CSV is only converted if its Parquet copy is missing or older than it,
+    so repeated loads read compressed columnar files instead of re-parsing CSV.
+    """
+    parquet_files = []
+    for csv_file in csv_files:
+        parquet_file = csv_file.parent / "parquet" / f"{csv_file.stem}.parquet"
+        if (not parquet_file.exists()
+                or parquet_file.stat().st_mtime < csv_file.stat().st_mtime):
+            parquet_file.parent.mkdir(exist_ok=True)
+            # COPY ... TO can't take a parameter, so quotes in the path are
+            # escaped instead
+            parquet_path = str(parquet_file).replace("'", "''")
+            try:
+                db.execute(f"""
+                    COPY (SELECT * FROM read_csv(?, auto_detect=false, header=true,
+                                                 delim=',', quote='"', escape='"',
+                                                 dateformat='%Y-%m-%d', columns={columns}))
+                    TO '{parquet_path}' (FORMAT PARQUET, COMPRESSION ZSTD)
+                """, [str(csv_file)])
+            except duckdb.Error as e:
+                # COPY wraps the reader's error in a generic "unsuccessful or
+                # closed pending query result" message; report the cause
+                cause = str(e).rsplit("\nError: ", 1)[-1].splitlines()[0]
+                raise ValueError(f"Could not convert {csv_file} to Parquet: {cause}") from e
+        parquet_files.append(parquet_file)
+    return parquet_files
+
+
+def combine_and_load_to_db(full_reload=False):
+    """Combine all CSV files and load them into DuckDB.
+
+    Only CSVs that are new or modified since they were last loaded (as
+    recorded in the loaded_files table) are read, unless full_reload is set
+    or the vote tables don't exist yet.
+    """
     # Get the directory containing the CSVs
     csv_dir = Path("downloaded_minutes/COMMON_COUNCIL")
     
-    # Initialize lists to store dataframes
-    summary_dfs = []
-    detailed_dfs = []
-    
-    # Get all CSV files
-    summary_files = sorted([f for f in csv_dir.glob("*_votes_summary.csv")])
-    detailed_files = sorted([f for f in csv_dir.glob("*_votes_detailed.csv")])
+    # Get all CSV files and their modification times in one directory scan
+    mtimes = {}
+    if csv_dir.is_dir():
+        with os.scandir(csv_dir) as entries:
+            mtimes = {Path(entry.path): entry.stat().st_mtime for entry in entries
+                      if entry.name.endswith(("_votes_summary.csv", "_votes_detailed.csv"))}
+    summary_files = sorted(f for f in mtimes if f.name.endswith("_votes_summary.csv"))
+    detailed_files = sorted(f for f in mtimes if f.name.endswith("_votes_detailed.csv"))
     
     print(f"\nFound {len(summary_files)} summary files and {len(detailed_files)} detailed files")
     
-    # Process summary files
-    for file in summary_files:
-        try:
-            # Extract date from filename (format: YYYY-MM-DD_votes_summary.csv)
-            date = file.stem.split('_')[0]
-            df = pd.read_csv(file)
-            df['meeting_date'] = pd.to_datetime(date).strftime('%Y-%m-%d')  # Convert to string format
-            summary_dfs.append(df)
-        except Exception as e:
-            print(f"Error processing summary file {file}: {e}")
-            continue
-    
-    # Process detailed files
-    for file in detailed_files:
-        try:
-            df = pd.read_csv(file)
-            # Date is already in the detailed files
-            df['meeting_date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')  # Convert to string format
-            detailed_dfs.append(df)
-        except Exception as e:
-            print(f"Error processing detailed file {file}: {e}")
-            continue
-    
-    # Combine all dataframes
-    if summary_dfs:
-        combined_summary = pd.concat(summary_dfs, ignore_index=True)
-        print(f"\nCombined summary data shape: {combined_summary.shape}")
-    else:
+    if not summary_files:
         print("\nNo summary data to combine")
         return
     
-    if detailed_dfs:
-        combined_detailed = pd.concat(detailed_dfs, ignore_index=True)
-        print(f"Combined detailed data shape: {combined_detailed.shape}")
-    else:
+    if not detailed_files:
         print("\nNo detailed data to combine")
         return
     
@@ -223,86 +293,83 @@ def combine_and_load_to_db():
     db = duckdb.connect('madison_votes.db')
     
     try:
-        # Create tables
-        print("Creating tables in DuckDB...")
+        # Load tables and views in one transaction (a single commit instead
+        # of one per statement, and no partial state if a step fails)
+        db.execute("BEGIN TRANSACTION")
         
-        # Create and load summary table
-        db.execute("""
-            CREATE TABLE IF NOT EXISTS votes_summary (
-                meeting_date DATE,
-                item_number VARCHAR,
-                motion_number VARCHAR,
-                motion_title VARCHAR,
-                motion_type VARCHAR,
-                legistar_number VARCHAR,
-                legistar_link VARCHAR,
-                description TEXT,
-                is_unanimous BOOLEAN,
-                total_ayes INTEGER,
-                total_noes INTEGER,
-                total_abstentions INTEGER,
-                total_excused INTEGER,
-                total_recused INTEGER,
-                total_non_voting INTEGER,
-                page_number INTEGER
-            )
-        """)
+        # Rebuild from scratch if the vote tables are missing or were created
+        # before item/motion numbers were stored as integers
+        item_number_types = dict(db.execute("""
+            SELECT table_name, data_type FROM information_schema.columns
+            WHERE table_schema = 'main' AND column_name = 'item_number'
+              AND table_name IN ('votes_summary', 'votes_by_member')
+        """).fetchall())
+        if item_number_types != {'votes_summary': 'INTEGER', 'votes_by_member': 'INTEGER'}:
+            full_reload = True
         
-        # Create and load detailed table
-        db.execute("""
-            CREATE TABLE IF NOT EXISTS votes_by_member (
-                meeting_date DATE,
-                item_number VARCHAR,
-                motion_number VARCHAR,
-                motion_type VARCHAR,
-                legistar_number VARCHAR,
-                member_name VARCHAR,
-                vote_type VARCHAR,
-                is_unanimous BOOLEAN
+        # Manifest of loaded CSVs, used to skip files that haven't changed
+        db.execute(f"""
+            {'CREATE OR REPLACE TABLE' if full_reload else 'CREATE TABLE IF NOT EXISTS'} loaded_files (
+                filename VARCHAR PRIMARY KEY,
+                mtime DOUBLE,
+                loaded_at TIMESTAMP DEFAULT current_timestamp
             )
         """)
+        loaded = dict(db.execute("SELECT filename, mtime FROM loaded_files").fetchall())
         
-        # Load data into tables
-        print("Loading data into DuckDB...")
-        db.register('summary_df', combined_summary)
-        db.register('detailed_df', combined_detailed)
+        new_summary_files = [f for f in summary_files if loaded.get(f.name) != mtimes[f]]
+        new_detailed_files = [f for f in detailed_files if loaded.get(f.name) != mtimes[f]]
         
-        # Use explicit CAST to DATE in the INSERT statements
-        db.execute("""
-            INSERT INTO votes_summary 
-            SELECT 
-                CAST(meeting_date AS DATE),
-                item_number,
-                motion_number,
-                motion_title,
-                motion_type,
-                legistar_number,
-                legistar_link,
-                description,
-                is_unanimous,
-                total_ayes,
-                total_noes,
-                total_abstentions,
-                total_excused,
-                total_recused,
-                total_non_voting,
-                page_number
-            FROM summary_df
-        """)
+        # CSVs loaded before but since deleted; their meetings are removed
+        on_disk = {f.name for f in mtimes}
+        removed_files = sorted(name for name in loaded if name not in on_disk)
         
-        db.execute("""
-            INSERT INTO votes_by_member 
-            SELECT 
-                CAST(meeting_date AS DATE),
-                item_number,
-                motion_number,
-                motion_type,
-                legistar_number,
-                member_name,
-                vote_type,
-                is_unanimous
-            FROM detailed_df
-        """)
+        print(f"{len(new_summary_files)} summary files and {len(new_detailed_files)} "
+              f"detailed files are new or changed, {len(removed_files)} were removed")
+        
+        # Create and load tables from the Parquet staging copies; DuckDB's
+        # reader scans all the files in parallel so there is no per-file
+        # pandas pass.
+        print("Loading data into DuckDB...")
+        for table, select, columns, order_by, suffix, new_files in [
+            ('votes_summary', SUMMARY_SELECT, SUMMARY_COLUMNS,
+             "meeting_date, item_number, motion_number",
+             "_votes_summary.csv", new_summary_files),
+            ('votes_by_member', DETAILED_SELECT, DETAILED_COLUMNS,
+             "meeting_date, item_number, motion_number, member_name",
+             "_votes_detailed.csv", new_detailed_files),
+        ]:
+            parquet_files = [str(f) for f in convert_csv_to_parquet(db, new_files, columns)]
+            # Filename format: YYYY-MM-DD_votes_*.csv
+            new_dates = [f.stem.split('_')[0] for f in new_files]
+            removed_dates = [name.split('_')[0] for name in removed_files if name.endswith(suffix)]
+            if full_reload:
+                db.execute(f"CREATE OR REPLACE TABLE {table} AS {select}", [parquet_files])
+            elif new_dates or removed_dates:
+                newest_date = db.execute(
+                    f"SELECT CAST(max(meeting_date) AS VARCHAR) FROM {table}"
+                ).fetchone()[0]
+                
+                # Replace the rows of any meeting whose CSV changed, and drop
+                # those whose CSV was deleted
+                db.executemany(f"DELETE FROM {table} WHERE meeting_date = CAST(? AS DATE)",
+                               [[date] for date in new_dates + removed_dates])
+                if new_dates:
+                    db.execute(f"INSERT INTO {table} {select}", [parquet_files])
+                
+                # Appended rows keep the table sorted (for its zone maps) only
+                # if they are no older than every meeting already loaded
+                if new_dates and newest_date is not None and min(new_dates) < newest_date:
+                    print(f"Re-sorting {table}...")
+                    db.execute(f"CREATE OR REPLACE TABLE {table} AS "
+                               f"SELECT * FROM {table} ORDER BY {order_by}")
+        
+        db.executemany("DELETE FROM loaded_files WHERE filename = ?",
+                       [[name] for name in removed_files])
+        db.executemany(
+            "INSERT OR REPLACE INTO loaded_files (filename, mtime) VALUES (?, ?)",
+            [[f.name, mtimes[f]] for f in new_summary_files + new_detailed_files]
+        )
         
         # Create some useful views
         print("Creating views...")
@@ -323,53 +390,92 @@ def combine_and_load_to_db():
                 total_non_voting
             FROM votes_summary
             WHERE NOT is_unanimous
-            ORDER BY meeting_date DESC, item_number::INTEGER, motion_number::INTEGER
+            ORDER BY meeting_date DESC, item_number, motion_number
         """)
         
-        # View for member voting patterns
+        # member_voting_patterns, votes_with_voters and most_active_voters are
+        # aggregations that only change when the vote tables do, so they are
+        # materialized once per load rather than recomputed on every read.
+        # Databases built by older versions of this script have the first two
+        # as views, which CREATE OR REPLACE TABLE cannot replace.
+        for (view_name,) in db.execute("""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_type = 'VIEW'
+              AND table_name IN ('member_voting_patterns', 'votes_with_voters')
+        """).fetchall():
+            db.execute(f"DROP VIEW {view_name}")
+        
+        # Table for member voting patterns
         db.execute("""
-            CREATE OR REPLACE VIEW member_voting_patterns AS
+            CREATE OR REPLACE TABLE member_voting_patterns AS
+            WITH totals AS (
+                SELECT member_name, COUNT(*) as total
+                FROM votes_by_member
+                WHERE NOT is_unanimous
+                GROUP BY member_name
+            )
             SELECT 
-                member_name,
-                vote_type,
+                v.member_name,
+                v.vote_type,
                 COUNT(*) as vote_count,
-                COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (PARTITION BY member_name) as vote_percentage
-            FROM votes_by_member
-            WHERE NOT is_unanimous
-            GROUP BY member_name, vote_type
-            ORDER BY member_name, vote_type
+                COUNT(*) * 100.0 / t.total as vote_percentage
+            FROM votes_by_member v
+            JOIN totals t USING (member_name)
+            WHERE NOT v.is_unanimous
+            GROUP BY v.member_name, v.vote_type, t.total
+            ORDER BY v.member_name, v.vote_type
         """)
         
-        # View for votes with concatenated voter names
+        # Table for votes with concatenated voter names. Voter lists are
+        # aggregated per motion first so the join to votes_summary is 1:1
+        # and there is no need to group by every summary column.
         db.execute("""
-            CREATE OR REPLACE VIEW votes_with_voters AS
+            CREATE OR REPLACE TABLE votes_with_voters AS
+            WITH voters AS (
+                SELECT 
+                    meeting_date,
+                    item_number,
+                    motion_number,
+                    STRING_AGG(member_name, '; ') FILTER (WHERE vote_type = 'AYE') as ayes_list,
+                    STRING_AGG(member_name, '; ') FILTER (WHERE vote_type = 'NO') as noes_list,
+                    STRING_AGG(member_name, '; ') FILTER (WHERE vote_type = 'ABSTAIN') as abstentions_list,
+                    STRING_AGG(member_name, '; ') FILTER (WHERE vote_type = 'EXCUSED') as excused_list,
+                    STRING_AGG(member_name, '; ') FILTER (WHERE vote_type = 'RECUSED') as recused_list,
+                    STRING_AGG(member_name, '; ') FILTER (WHERE vote_type = 'NON_VOTING') as non_voting_list
+                FROM votes_by_member
+                GROUP BY meeting_date, item_number, motion_number
+            )
             SELECT 
                 s.*,
-                STRING_AGG(CASE WHEN d.vote_type = 'AYE' THEN d.member_name END, '; ') 
-                    FILTER (WHERE d.vote_type = 'AYE') as ayes_list,
-                STRING_AGG(CASE WHEN d.vote_type = 'NO' THEN d.member_name END, '; ') 
-                    FILTER (WHERE d.vote_type = 'NO') as noes_list,
-                STRING_AGG(CASE WHEN d.vote_type = 'ABSTAIN' THEN d.member_name END, '; ') 
-                    FILTER (WHERE d.vote_type = 'ABSTAIN') as abstentions_list,
-                STRING_AGG(CASE WHEN d.vote_type = 'EXCUSED' THEN d.member_name END, '; ') 
-                    FILTER (WHERE d.vote_type = 'EXCUSED') as excused_list,
-                STRING_AGG(CASE WHEN d.vote_type = 'RECUSED' THEN d.member_name END, '; ') 
-                    FILTER (WHERE d.vote_type = 'RECUSED') as recused_list,
-                STRING_AGG(CASE WHEN d.vote_type = 'NON_VOTING' THEN d.member_name END, '; ') 
-                    FILTER (WHERE d.vote_type = 'NON_VOTING') as non_voting_list
+                v.ayes_list,
+                v.noes_list,
+                v.abstentions_list,
+                v.excused_list,
+                v.recused_list,
+                v.non_voting_list
             FROM votes_summary s
-            LEFT JOIN votes_by_member d 
-                ON s.meeting_date = d.meeting_date 
-                AND s.item_number = d.item_number 
-                AND s.motion_number = d.motion_number
-            GROUP BY 
-                s.meeting_date, s.item_number, s.motion_number, s.motion_title, 
-                s.motion_type, s.legistar_number, s.legistar_link, s.description, 
-                s.is_unanimous, s.total_ayes, s.total_noes, s.total_abstentions, 
-                s.total_excused, s.total_recused, s.total_non_voting, s.page_number
-            ORDER BY s.meeting_date DESC, s.item_number::INTEGER, s.motion_number::INTEGER
+            LEFT JOIN voters v 
+                ON s.meeting_date = v.meeting_date 
+                AND s.item_number = v.item_number 
+                AND s.motion_number = v.motion_number
+            ORDER BY s.meeting_date DESC, s.item_number, s.motion_number
+        """)
+        
+        # Table for the query app's most active voters view
+        db.execute("""
+            CREATE OR REPLACE TABLE most_active_voters AS
+            SELECT 
+                member_name,
+                COUNT(*) as vote_count,
+                COUNT(DISTINCT meeting_date) as meetings_attended
+            FROM votes_by_member
+            GROUP BY member_name
+            ORDER BY vote_count DESC
         """)
         
+        # Refresh optimizer statistics for the reloaded tables
+        db.execute("ANALYZE")
+        
         print("\nSuccessfully loaded data into DuckDB!")
         
         # Print some summary statistics
@@ -396,21 +502,24 @@ def combine_and_load_to_db():
         print(f"Non-unanimous votes: {non_unanimous}")
         
         print("\nMost common vote types:")
-        print(db.execute("""
+        vote_type_counts = db.execute("""
             SELECT vote_type, COUNT(*) as count
             FROM votes_by_member
             GROUP BY vote_type
             ORDER BY count DESC
-        """).fetch_df().to_string())
+        """).fetchall()
+        for vote_type, count in vote_type_counts:
+            print(f"  {vote_type}: {count}")
+
+        db.execute("COMMIT")
 
         # Load alders dimension table if available
         print("\n" + "-" * 50)
-        db.close()
-        load_alders_to_db()
-        return
+        load_alders_to_db(db)
 
     except Exception as e:
         print(f"Error loading data into DuckDB: {e}")
+        rollback(db)
     finally:
         db.close()
 
@@ -419,4 +528,4 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "--alders-only":
         load_alders_to_db()
     else:
-        combine_and_load_to_db()
\ No newline at end of file
+        combine_and_load_to_db(full_reload="--full-reload" in sys.argv)
\ No newline at end of file
@@ -1,13 +1,147 @@
+import csv
+import json
+import logging
 import os
 import re
+import sys
+import unicodedata
 import pdfplumber
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Regexes used while scanning minutes text, compiled once at import
+ITEM_NUMBER_RE = re.compile(r'(?m)^\s*(\d+)\.\s+(\d+)')  # Matches "8. 78911" at start of line
+MOTION_TYPE_RE = re.compile(r'(?:(?P<amendment>Adopt the Following Amendment)|Adopt(?P<unanimous>\s+Unanimously)?)')  # Different types of motions
+HEADER_RE = re.compile(r'(Ayes|Noes|Abstentions|Recused|Excused|Non Voting):\s*(\d+)\s*-\s*')  # Matches "Ayes: 7- "
+VOTE_SECTION_START_RE = re.compile(r'(?:Ayes|Noes|Abstentions|Recused|Excused|Non Voting):\s*\d+\s*-', re.IGNORECASE)
+# Lines that close a vote section, in order of preference
+ENACTMENT_RE = re.compile(r'Enactment No:', re.IGNORECASE)
+PAGE_FOOTER_RE = re.compile(r'City of Madison Page', re.IGNORECASE)
+# Agenda sections that can follow a vote and should not be read as names,
+# keyed by regex group name and listed in the order they take precedence
+AGENDA_SECTION_MARKERS = {
+    'roll_call': 'ROLL CALL',
+    'swearing_in': 'SWEARING IN',
+    'convene': 'CONVENE',
+    'adjourn': 'ADJOURN',
+    'refer_all': 'REFER ALL'
+}
+AGENDA_SECTION_RE = re.compile(
+    '|'.join(f'(?P<{name}>{marker})' for name, marker in AGENDA_SECTION_MARKERS.items()),
+    re.IGNORECASE
+)
+# Vote type headers used in the minutes and the VoteRecord field each one fills
+VOTE_SECTION_FIELDS = {
+    'Ayes': 'ayes',
+    'Noes': 'noes',
+    'Abstentions': 'abstentions',
+    'Recused': 'recused',
+    'Excused': 'excused',
+    'Non Voting': 'non_voting'
+}
+NON_VOTING_RE = re.compile(r'Non Voting:\s*\d+\s*-\s*([^;\n]+?)(?=(?:Enactment No:|City of Madison Page|\d{5,6}|$))')  # Fallback for non-voting names
+
+# parse_names cleanup patterns
+NAME_END_MARKER_RE = re.compile(
+    '|'.join([ENACTMENT_RE.pattern, PAGE_FOOTER_RE.pattern, r'\d{5,6}', *AGENDA_SECTION_MARKERS.values()]),  # \d{5,6} is a Legistar number
+    re.IGNORECASE
+)
+NON_NAME_RE = re.compile(
+    r'city of madison|page|substitute|sponsor|refer|adjourn|swearing|convene|roll call',
+    re.IGNORECASE
+)
+NAME_SEPARATOR_RE = re.compile(r'\s*(?:and|;)\s*', re.IGNORECASE)
+VOTE_HEADER_PREFIX_RE = re.compile(r'(?:Ayes|Noes|Excused|Recused|Non Voting):\s*\d+\s*-\s*')
+
+# A page must contain one of these to hold any vote information
+VOTE_KEYWORD_RE = re.compile(r'Ayes:|Noes:|Adopt')
+# Looser form of VOTE_KEYWORD_RE for a page's raw characters, which have no
+# reliable spacing or line breaks: matched case-insensitively against the
+# characters with all whitespace removed
+RAW_VOTE_KEYWORD_RE = re.compile(r'ayes:|noes:|adopt', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+def _page_text(page) -> str:
+    """Extract a page's text, or "" if the page can't contain a vote.
+
+    The page's raw characters (already parsed by pdfminer) are checked for a
+    vote keyword first, so extract_text()'s word and line layout is skipped
+    on pages without one. The check is deliberately loose: characters are
+    NFKC-normalized (splitting ligatures) and compared without whitespace or
+    case, so a keyword broken up by spacing or kerning still passes.
+    """
+    raw_text = unicodedata.normalize("NFKC", "".join(char["text"] for char in page.chars))
+    if not RAW_VOTE_KEYWORD_RE.search(WHITESPACE_RE.sub("", raw_text)):
+        return ""
+    return page.extract_text() or ""
+
+# Bump when _page_text's output changes so stale page text caches are re-extracted
+PAGE_TEXT_CACHE_VERSION = 2
+
+def _page_text_cache_path(pdf_path: str) -> Path:
+    """Sidecar file holding a PDF's extracted page texts."""
+    return Path(pdf_path).with_suffix('.pages.json')
+
+# PDF handle for page text extraction in worker processes, one per process
+_worker_pdf = None
+
+def _open_worker_pdf(pdf_path: str):
+    """Open the PDF once in each worker process."""
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+def _extract_page_text(page_index: int) -> str:
+    """Extract the text of one page in a worker process."""
+    return _page_text(_worker_pdf.pages[page_index])
+
+@lru_cache(maxsize=2048)
+def _parse_names(names_str: str) -> Tuple[str, ...]:
+    """Parse a string of names into a tuple (cached; roll calls repeat across votes)."""
+    if not names_str:
+        return ()
+    
+    # Clean up the input string
+    names_str = names_str.strip()
+    
+    # Remove any text after the first marker that indicates end of names list
+    marker_match = NAME_END_MARKER_RE.search(names_str)
+    if marker_match:
+        names_str = names_str[:marker_match.start()]
+    
+    # Split on semicolons and " and "
+    names = []
+    for part in NAME_SEPARATOR_RE.split(names_str):
+        # Fix common OCR issues with names
+        name = ' '.join(part.split())  # Replace multiple spaces with single space
+        name = VOTE_HEADER_PREFIX_RE.sub('', name)  # Remove vote type headers
+        if name.endswith(('.', ',')):  # Remove trailing punctuation
+            name = name[:-1]
+        name = name.strip()
+        if name and not NON_NAME_RE.search(name):
+            names.append(sys.intern(name))  # Member names repeat across every vote
+    
+    return tuple(names)
+
 @dataclass
 class VoteRecord:
+    # Text fields (motion_title, description and member names) are stripped
+    # when the record is built, so consumers can use them as-is.
+    # Slots instead of a per-instance __dict__ (listed by hand to keep
+    # Python 3.9 support; dataclass(slots=True) needs 3.10)
+    __slots__ = (
+        'item_number', 'motion_number', 'motion_title', 'motion_type',
+        'legistar_number', 'legistar_link', 'description', 'is_unanimous',
+        'ayes', 'ayes_count', 'noes', 'noes_count', 'abstentions', 'abstentions_count',
+        'excused', 'excused_count', 'recused', 'recused_count',
+        'non_voting', 'non_voting_count', 'page_number'
+    )
+    
     item_number: str
     motion_number: str
     motion_title: str
@@ -31,114 +165,115 @@ class VoteRecord:
     page_number: int
 
 class CommonCouncilVoteExtractor:
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, max_workers: Optional[int] = None, use_cache: bool = True):
         self.pdf_path = pdf_path
-        self.vote_patterns = {
-            'item_number': r'(?m)^\s*(\d+)\.\s+(\d+)',  # Matches "8. 78911" at start of line
-            'sponsors': r'Sponsors?:\s*([^\n]+)',  # Matches "Sponsors: Name1, Name2"
-            'motion_type': r'(?:Adopt the Following Amendment|Adopt(?:\s+Unanimously)?)',  # Different types of motions
-            'ayes': r'Ayes:\s*(\d+)\s*-\s*(.*?)(?=(?:\s+Noes:|Abstentions:|Recused:|Excused:|Non Voting:|$))',  # Matches "Ayes: 7- Names..."
-            'noes': r'Noes:\s*(\d+)\s*-\s*(.*?)(?=(?:\s+Abstentions:|Recused:|Excused:|Non Voting:|$))',  # Matches "Noes: 12- Names..."
-            'abstentions': r'Abstentions:\s*(\d+)\s*-\s*(.*?)(?=(?:\s+Recused:|Excused:|Non Voting:|$))',  # Matches "Abstentions: 1- Names..."
-            'recused': r'Recused:\s*(\d+)\s*-\s*(.*?)(?=(?:\s+Excused:|Non Voting:|$))',  # Matches "Recused: 2- Names..."
-            'excused': r'Excused:\s*(\d+)\s*-\s*(.*?)(?=(?:\s+Non Voting:|$))',  # Matches "Excused: 1- Names..."
-            'non_voting': r'Non Voting:\s*(\d+)\s*-\s*([^;\n]+?)(?=(?:Enactment No:|City of Madison Page|\d{5,6}|$))',  # Simplified non-voting pattern
-            'enactment': r'Enactment No:\s*([^\n]+)'  # Matches "Enactment No: ORD-24-00041"
-        }
+        self.max_workers = max_workers or os.cpu_count() or 1  # Processes for page text extraction
+        self.use_cache = use_cache  # Read and write the on-disk page text cache
         self.pdf = pdfplumber.open(pdf_path)
+        self._page_texts = None  # Filled on first use by _get_page_texts
+
+    def close(self):
+        """Close the underlying PDF."""
+        self.pdf.close()
+
+    def __enter__(self):
+        return self
 
-    def __del__(self):
-        """Clean up PDF resources when object is destroyed."""
-        if hasattr(self, 'pdf'):
-            self.pdf.close()
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _page_text_cache_key(self) -> List[int]:
+        """Cache key for the PDF: cache format version, file mtime and size."""
+        stat = os.stat(self.pdf_path)
+        return [PAGE_TEXT_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+
+    def _read_page_text_cache(self) -> Optional[List[str]]:
+        """Return the cached page texts, or None if missing or stale."""
+        try:
+            with open(_page_text_cache_path(self.pdf_path), encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cache.get('key') != self._page_text_cache_key():
+            return None
+        return cache['pages']
+
+    def _write_page_text_cache(self, page_texts: List[str]):
+        """Save page texts next to the PDF; a failed write only costs a re-extraction."""
+        cache_path = _page_text_cache_path(self.pdf_path)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': self._page_text_cache_key(), 'pages': page_texts}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write page text cache %s: %s", cache_path, e)
+
+    def _get_page_texts(self) -> List[str]:
+        """Extract the text of every page once and reuse it on later calls.
+
+        Text extraction (pdfminer layout analysis) is CPU-bound, so pages are
+        spread across worker processes; results come back in page order.
+        Minutes rarely change once published, so the texts are also cached
+        on disk and reused while the PDF's mtime and size are unchanged.
+        """
+        if self._page_texts is None and self.use_cache:
+            self._page_texts = self._read_page_text_cache()
+            if self._page_texts is not None:
+                logger.debug("Using cached page text: %s", _page_text_cache_path(self.pdf_path))
+        if self._page_texts is None:
+            page_count = len(self.pdf.pages)
+            workers = min(self.max_workers, page_count)
+            if workers <= 1:
+                self._page_texts = [_page_text(page) for page in self.pdf.pages]
+            else:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_open_worker_pdf,
+                                         initargs=(self.pdf_path,)) as executor:
+                    self._page_texts = list(executor.map(
+                        _extract_page_text, range(page_count),
+                        chunksize=max(1, page_count // (workers * 4))
+                    ))
+            if self.use_cache:
+                self._write_page_text_cache(self._page_texts)
+        return self._page_texts
 
     def extract_text_with_pages(self) -> List[Tuple[str, int]]:
         """Extract text from PDF with page numbers."""
         text_pages = []
         try:
-            print(f"\nOpening PDF: {self.pdf_path}")
-            with pdfplumber.open(self.pdf_path) as pdf:
-                print(f"Successfully opened PDF. Total pages: {len(pdf.pages)}")
-                for i, page in enumerate(pdf.pages, 1):
-                    print(f"\nProcessing page {i}/{len(pdf.pages)}")
-                    text = page.extract_text()
-                    if text:
-                        # Only include pages that might have votes
-                        if any(pattern in text for pattern in ['Ayes:', 'Noes:', 'Adopt']):
-                            print(f"Found potential vote information on page {i}")
-                            text_pages.append((text, i))
-                        else:
-                            print(f"No vote information found on page {i}")
-                    else:
-                        print(f"Warning: No text extracted from page {i}")
+            logger.debug("Reading PDF: %s", self.pdf_path)
+            page_texts = self._get_page_texts()
+            logger.debug("Total pages: %d", len(page_texts))
+            for i, text in enumerate(page_texts, 1):
+                logger.debug("Processing page %d/%d", i, len(page_texts))
+                # Only include pages that might have votes (pages that failed
+                # the _page_text prefilter or have no text at all are empty)
+                if VOTE_KEYWORD_RE.search(text):
+                    logger.debug("Found potential vote information on page %d", i)
+                    text_pages.append((text, i))
+                else:
+                    logger.debug("No vote information found on page %d", i)
         except Exception as e:
-            print(f"Error extracting text from PDF: {e}")
+            logger.error("Error extracting text from PDF: %s", e)
         return text_pages
 
     def parse_names(self, names_str: str) -> List[str]:
         """Parse a string of names into a list."""
-        if not names_str:
-            return []
-        
-        # Clean up the input string
-        names_str = names_str.strip()
-        
-        # Remove any text after specific markers that indicate end of names list
-        markers = [
-            r'Enactment No:',
-            r'City of Madison Page',
-            r'\d{5,6}',  # Legistar numbers
-            r'REFER ALL',
-            r'ADJOURN',
-            r'SWEARING IN',
-            r'CONVENE',
-            r'ROLL CALL'
-        ]
-        for marker in markers:
-            names_str = re.split(marker, names_str, flags=re.IGNORECASE)[0]
-        
-        # Handle common OCR/formatting issues
-        names_str = re.sub(r'\s*and\s*', ';', names_str, flags=re.IGNORECASE)  # Replace " and " with semicolon
-        names_str = re.sub(r'\s*;\s*', ';', names_str)  # Normalize semicolons
-        
-        # Split on semicolons
-        names = []
-        for part in names_str.split(';'):
-            name = part.strip()
-            if name:
-                # Fix common OCR issues with names
-                name = re.sub(r'\s+', ' ', name)  # Replace multiple spaces with single space
-                name = re.sub(r'(?:Ayes|Noes|Excused|Recused|Non Voting):\s*\d+\s*-\s*', '', name)  # Remove vote type headers
-                name = re.sub(r'[.,;]$', '', name)  # Remove trailing punctuation
-                name = name.strip()
-                if name and not any(keyword in name.lower() for keyword in [
-                    'city of madison', 'page', 'substitute', 'sponsor',
-                    'refer', 'adjourn', 'swearing', 'convene', 'roll call'
-                ]):
-                    names.append(name)
-        
-        return [n for n in names if n]  # Filter out any empty strings
+        return list(_parse_names(names_str))
 
     def find_votes_in_text(self, text: str) -> List[Dict]:
         """Find all vote sections in a text block."""
         votes = []
-        current_pos = 0
         
-        # Look for motion types that indicate a vote
-        while True:
-            # Find next motion type
-            motion_match = re.search(self.vote_patterns['motion_type'], text[current_pos:])
-            if not motion_match:
-                break
-                
-            start_pos = current_pos + motion_match.start()
-            # Find the next motion or end of text
-            next_motion = re.search(self.vote_patterns['motion_type'], text[start_pos + 1:])
-            end_pos = current_pos + len(text) if not next_motion else start_pos + next_motion.start()
+        # Look for motion types that indicate a vote; each vote runs until
+        # the next motion or the end of the text
+        motion_matches = list(MOTION_TYPE_RE.finditer(text))
+        for i, motion_match in enumerate(motion_matches):
+            end_pos = motion_matches[i + 1].start() if i + 1 < len(motion_matches) else len(text)
             
-            vote_text = text[start_pos:end_pos]
-            motion_type = 'Amendment' if 'Amendment' in motion_match.group(0) else 'Main Motion'
-            is_unanimous = 'Unanimously' in motion_match.group(0)
+            vote_text = text[motion_match.start():end_pos]
+            motion_type = 'Amendment' if motion_match.group('amendment') else 'Main Motion'
+            is_unanimous = motion_match.group('unanimous') is not None
             
             vote_info = {
                 'motion_title': motion_match.group(0),
@@ -147,7 +282,6 @@ class CommonCouncilVoteExtractor:
                 'text': vote_text
             }
             votes.append(vote_info)
-            current_pos = start_pos + 1
             
         return votes
 
@@ -156,27 +290,22 @@ class CommonCouncilVoteExtractor:
         vote_records = []
         pending_vote = None  # Track votes that might continue on next page
         
-        # First pass: collect all text and identify page boundaries
-        pages_text = []
-        for page_num in range(len(self.pdf.pages)):
-            page = self.pdf.pages[page_num]
-            text = page.extract_text()
-            pages_text.append(text)
-            
-            print(f"\nProcessing page {page_num + 1}/{len(self.pdf.pages)}")
+        pages_text = self._get_page_texts()
+        for page_num, text in enumerate(pages_text):
+            logger.debug("Processing page %d/%d", page_num + 1, len(pages_text))
             
             # Skip pages without vote information
-            if not any(pattern in text for pattern in ["Adopt", "Ayes:", "Noes:"]):
-                print("No vote information found on page", page_num + 1)
+            if not VOTE_KEYWORD_RE.search(text):
+                logger.debug("No vote information found on page %d", page_num + 1)
                 continue
                 
-            print("Found potential vote information on page", page_num + 1)
+            logger.debug("Found potential vote information on page %d", page_num + 1)
             
             # Find all agenda items with their Legistar numbers
-            item_matches = list(re.finditer(self.vote_patterns['item_number'], text))
+            item_matches = list(ITEM_NUMBER_RE.finditer(text))
             
             if item_matches:
-                print(f"\nFound {len(item_matches)} agenda items on page {page_num + 1}")
+                logger.debug("Found %d agenda items on page %d", len(item_matches), page_num + 1)
                 
                 for i, match in enumerate(item_matches):
                     item_num = match.group(1)
@@ -193,9 +322,11 @@ class CommonCouncilVoteExtractor:
                         
                         # If we find a complete vote section (has both Ayes and either end marker or new motion),
                         # process it and clear pending
-                        if (('Ayes:' in pending_vote['text'] and 
-                             any(marker in item_text for marker in ['City of Madison Page', 'Adopt'])) or
-                            all(marker in pending_vote['text'] for marker in ['Ayes:', 'Noes:', 'Excused:', 'Non Voting:'])):
+                        pending_text = pending_vote['text']
+                        if (('Ayes:' in pending_text and
+                             ('City of Madison Page' in item_text or 'Adopt' in item_text)) or
+                            ('Ayes:' in pending_text and 'Noes:' in pending_text and
+                             'Excused:' in pending_text and 'Non Voting:' in pending_text)):
                             vote_record = self._process_item(
                                 item_number=pending_vote['item_number'],
                                 legistar_number=pending_vote['legistar_number'],
@@ -208,38 +339,27 @@ class CommonCouncilVoteExtractor:
                             )
                             if vote_record:
                                 vote_records.append(vote_record)
-                                print(f"Found complete vote record for item {item_num}, vote {pending_vote['motion_number']} ({vote_record.motion_type})")
+                                logger.debug("Found complete vote record for item %s, vote %s (%s)", item_num, pending_vote['motion_number'], vote_record.motion_type)
                             pending_vote = None
                         continue
                     
                     # Find all motions in this item
-                    motion_number = 0
-                    remaining_text = item_text
-                    while True:
-                        # Find next motion type
-                        motion_match = re.search(self.vote_patterns['motion_type'], remaining_text)
-                        if not motion_match:
-                            break
-                            
-                        motion_number += 1
-                        motion_start = motion_match.start()
+                    motion_matches = list(MOTION_TYPE_RE.finditer(item_text))
+                    for motion_number, motion_match in enumerate(motion_matches, 1):
                         motion_type = motion_match.group(0)
                         
                         # Get text until next motion or end of item
-                        next_motion = re.search(self.vote_patterns['motion_type'], remaining_text[motion_start + 1:])
-                        if next_motion:
-                            motion_text = remaining_text[motion_start:motion_start + next_motion.start() + 1]
-                            remaining_text = remaining_text[motion_start + next_motion.start() + 1:]
-                        else:
-                            motion_text = remaining_text[motion_start:]
-                            remaining_text = ""
+                        motion_end = (motion_matches[motion_number].start()
+                                      if motion_number < len(motion_matches) else len(item_text))
+                        motion_text = item_text[motion_match.start():motion_end]
                         
                         # Check if this is a unanimous vote
-                        is_unanimous = "Unanimously" in motion_type
+                        is_unanimous = motion_match.group('unanimous') is not None
                         
                         # Check if this vote might continue on next page
-                        if ('Ayes:' in motion_text and 
-                            not all(marker in motion_text for marker in ['Noes:', 'Excused:', 'Non Voting:'])):
+                        if ('Ayes:' in motion_text and
+                            not ('Noes:' in motion_text and 'Excused:' in motion_text and
+                                 'Non Voting:' in motion_text)):
                             # This vote might continue - save it as pending
                             pending_vote = {
                                 'item_number': item_num,
@@ -250,7 +370,7 @@ class CommonCouncilVoteExtractor:
                                 'motion_type': "Main Motion",
                                 'is_unanimous': is_unanimous
                             }
-                            print(f"Found potentially incomplete vote for item {item_num}, vote {motion_number}")
+                            logger.debug("Found potentially incomplete vote for item %s, vote %d", item_num, motion_number)
                         else:
                             # Process the complete vote
                             vote_record = self._process_item(
@@ -266,467 +386,332 @@ class CommonCouncilVoteExtractor:
                             
                             if vote_record:
                                 vote_records.append(vote_record)
-                                print(f"Found complete vote record for item {item_num}, vote {motion_number} ({vote_record.motion_type})")
-                        
-                        if not remaining_text:
-                            break
+                                logger.debug("Found complete vote record for item %s, vote %d (%s)", item_num, motion_number, vote_record.motion_type)
         
-        print(f"\nTotal vote records found: {len(vote_records)}")
+        logger.info("Total vote records found: %d", len(vote_records))
         return vote_records
 
     def _process_item(self, item_number: str, legistar_number: str, text: str, 
                      page_number: int, motion_number: str, motion_title: str,
                      motion_type: str, is_unanimous: bool) -> Optional[VoteRecord]:
         """Process a single agenda item text to extract vote information."""
-        print(f"\nProcessing {motion_type} vote {motion_number} for item {item_number}")
-        print(f"Vote text length: {len(text)} characters")
+        logger.debug("Processing %s vote %s for item %s", motion_type, motion_number, item_number)
+        logger.debug("Vote text length: %d characters", len(text))
         
         # Create Legistar link
         legistar_link = f"https://madison.legistar.com/gateway.aspx?m=l&id=/matter.aspx?key={legistar_number}"
         
-        # Extract description (text before the motion)
-        description = text.split(motion_title)[0].strip() if motion_title in text else ""
-        # Extract description (text before the motion)
-        description = text.split(motion_title)[0].strip() if motion_title in text else ""
+        # Extract description (text before the motion). Callers pass text that
+        # starts at the motion, so there is none.
+        description = ""
         
-        # Initialize vote counts and lists
-        ayes = []
-        ayes_count = 0
-        noes = []
-        noes_count = 0
-        abstentions = []
-        abstentions_count = 0
-        excused = []
-        excused_count = 0
-        recused = []
-        recused_count = 0
-        non_voting = []
-        non_voting_count = 0
+        # Initialize vote lists and counts, keyed by section header
+        names_by_section = {section: [] for section in VOTE_SECTION_FIELDS}
+        counts_by_section = dict.fromkeys(VOTE_SECTION_FIELDS, 0)
         
         # For unanimous votes without explicit counts, we'll mark it specially
         if is_unanimous:
-            print("Found unanimous vote")
-            ayes = ["UNANIMOUS"]
-            ayes_count = -1  # Special marker for unanimous
+            logger.debug("Found unanimous vote")
+            names_by_section['Ayes'] = ["UNANIMOUS"]
+            counts_by_section['Ayes'] = -1  # Special marker for unanimous
             
         else:
-            print("Processing non-unanimous vote...")
+            logger.debug("Processing non-unanimous vote...")
             
             # Only trim the text if we find a complete vote section followed by unrelated content
-            print("Looking for vote section boundaries...")
+            logger.debug("Looking for vote section boundaries...")
+            # The vote section runs from the first vote header to the next
+            # enactment line, or failing that the next page footer
             vote_section_end = None
-            for pattern in [
-                r'(?:Ayes|Noes|Abstentions|Recused|Excused|Non Voting):\s*\d+\s*-.*?(?=Enactment No:)',
-                r'(?:Ayes|Noes|Abstentions|Recused|Excused|Non Voting):\s*\d+\s*-.*?(?=City of Madison Page)'
-            ]:
-                try:
-                    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-                    if match:
-                        vote_section_end = match.end()
-                        print(f"Found vote section ending at position {vote_section_end}")
-                        break
-                except Exception as e:
-                    print(f"Error searching for vote section: {e}")
+            section_start = VOTE_SECTION_START_RE.search(text)
+            if section_start:
+                section_end = (ENACTMENT_RE.search(text, section_start.end())
+                               or PAGE_FOOTER_RE.search(text, section_start.end()))
+                if section_end:
+                    vote_section_end = section_end.start()
+                    logger.debug("Found vote section ending at position %d", vote_section_end)
             
             if vote_section_end:
-                print("Looking for boundaries after vote section...")
-                # Look for boundaries after the vote section
-                boundaries = [
-                    'ROLL CALL',
-                    'SWEARING IN',
-                    'CONVENE',
-                    'ADJOURN',
-                    'REFER ALL'
-                ]
-                remaining_text = text[vote_section_end:]
-                print(f"Remaining text length: {len(remaining_text)} characters")
-                for boundary in boundaries:
-                    try:
-                        match = re.search(boundary, remaining_text, re.IGNORECASE)
-                        if match:
-                            text = text[:vote_section_end + match.start()]
-                            print(f"Trimmed text at boundary '{boundary}'")
-                            break
-                    except Exception as e:
-                        print(f"Error searching for boundary '{boundary}': {e}")
-            
-            print("Splitting text into vote sections...")
-            # Split text into sections based on vote type headers
-            try:
-                sections = re.split(r'((?:Ayes|Noes|Abstentions|Recused|Excused|Non Voting):\s*\d+\s*-\s*)', text)
-                print(f"Found {len(sections)} sections")
-            except Exception as e:
-                print(f"Error splitting text into sections: {e}")
-                sections = []
-            
-            current_section = None
-            current_names = []
+                logger.debug("Looking for boundaries after vote section...")
+                logger.debug("Remaining text length: %d characters", len(text) - vote_section_end)
+                # Scan once for all agenda section markers after the vote section,
+                # then cut at the first one found in order of precedence
+                boundary_starts = {}
+                for match in AGENDA_SECTION_RE.finditer(text, vote_section_end):
+                    boundary_starts.setdefault(match.lastgroup, match.start())
+                for name, boundary in AGENDA_SECTION_MARKERS.items():
+                    if name in boundary_starts:
+                        text = text[:boundary_starts[name]]
+                        logger.debug("Trimmed text at boundary '%s'", boundary)
+                        break
             
-            for i, section in enumerate(sections):
-                print(f"Processing section {i+1}/{len(sections)} (length: {len(section)} chars)")
-                if not section.strip():
-                    continue
-                
-                # Check if this is a header
-                try:
-                    header_match = re.match(r'(Ayes|Noes|Abstentions|Recused|Excused|Non Voting):\s*(\d+)\s*-\s*', section)
-                    if header_match:
-                        print(f"Found header: {header_match.group(1)} with count {header_match.group(2)}")
-                        # Process previous section if exists
-                        if current_section and current_names:
-                            names = self.parse_names(' '.join(current_names))
-                            print(f"Processing {len(names)} names from {current_section}")
-                            if current_section == 'Ayes':
-                                ayes.extend(names)
-                            elif current_section == 'Noes':
-                                noes.extend(names)
-                            elif current_section == 'Abstentions':
-                                abstentions.extend(names)
-                            elif current_section == 'Recused':
-                                recused.extend(names)
-                            elif current_section == 'Excused':
-                                excused.extend(names)
-                            elif current_section == 'Non Voting':
-                                non_voting.extend(names)
-                        
-                        # Start new section
-                        current_section = header_match.group(1)
-                        count = int(header_match.group(2))
-                        if current_section == 'Ayes':
-                            ayes_count = count
-                        elif current_section == 'Noes':
-                            noes_count = count
-                        elif current_section == 'Abstentions':
-                            abstentions_count = count
-                        elif current_section == 'Recused':
-                            recused_count = count
-                        elif current_section == 'Excused':
-                            excused_count = count
-                        elif current_section == 'Non Voting':
-                            non_voting_count = count
-                        current_names = []
-                    else:
-                        # This is content, add to current section
-                        if current_section:
-                            current_names.append(section)
-                except Exception as e:
-                    print(f"Error processing section {i+1}: {e}")
+            logger.debug("Finding vote sections...")
+            # Each vote type header ("Ayes: 7- ") starts a section whose names
+            # run until the next header or the end of the text
+            header_matches = list(HEADER_RE.finditer(text))
+            logger.debug("Found %d vote sections", len(header_matches))
             
-            # Process the last section
-            if current_section and current_names:
+            for i, header_match in enumerate(header_matches):
                 try:
-                    names = self.parse_names(' '.join(current_names))
-                    print(f"Processing final section: {current_section} with {len(names)} names")
-                    if current_section == 'Ayes':
-                        ayes.extend(names)
-                    elif current_section == 'Noes':
-                        noes.extend(names)
-                    elif current_section == 'Abstentions':
-                        abstentions.extend(names)
-                    elif current_section == 'Recused':
-                        recused.extend(names)
-                    elif current_section == 'Excused':
-                        excused.extend(names)
-                    elif current_section == 'Non Voting':
-                        non_voting.extend(names)
+                    current_section = header_match.group(1)
+                    count = int(header_match.group(2))
+                    logger.debug("Found header: %s with count %d", current_section, count)
+                    counts_by_section[current_section] = count
+                    
+                    section_end = header_matches[i + 1].start() if i + 1 < len(header_matches) else len(text)
+                    names_text = text[header_match.end():section_end]
+                    if not names_text.strip():
+                        continue
+                    names = self.parse_names(names_text)
+                    logger.debug("Processing %d names from %s", len(names), current_section)
+                    names_by_section[current_section].extend(names)
                 except Exception as e:
-                    print(f"Error processing final section: {e}")
+                    logger.error("Error processing section %d: %s", i + 1, e)
             
             # If we have a non-voting count but no names, try to extract from the text
-            if non_voting_count > 0 and not non_voting:
-                print("Attempting to extract missing non-voting names...")
+            if counts_by_section['Non Voting'] > 0 and not names_by_section['Non Voting']:
+                logger.debug("Attempting to extract missing non-voting names...")
                 try:
-                    non_voting_match = re.search(r'Non Voting:\s*\d+\s*-\s*([^;\n]+?)(?=(?:Enactment No:|City of Madison Page|\d{5,6}|$))', text)
+                    non_voting_match = NON_VOTING_RE.search(text)
                     if non_voting_match:
-                        non_voting = self.parse_names(non_voting_match.group(1))
-                        print(f"Found {len(non_voting)} non-voting names in second pass")
+                        names_by_section['Non Voting'] = self.parse_names(non_voting_match.group(1))
+                        logger.debug("Found %d non-voting names in second pass", len(names_by_section['Non Voting']))
                 except Exception as e:
-                    print(f"Error extracting non-voting names: {e}")
+                    logger.error("Error extracting non-voting names: %s", e)
             
-            if ayes:
-                print(f"Found {len(ayes)} ayes (count: {ayes_count}): {ayes}")
-            if noes:
-                print(f"Found {len(noes)} noes (count: {noes_count}): {noes}")
-            if abstentions:
-                print(f"Found {len(abstentions)} abstentions (count: {abstentions_count}): {abstentions}")
-            if recused:
-                print(f"Found {len(recused)} recused (count: {recused_count}): {recused}")
-            if excused:
-                print(f"Found {len(excused)} excused (count: {excused_count}): {excused}")
-            if non_voting:
-                print(f"Found {len(non_voting)} non-voting (count: {non_voting_count}): {non_voting}")
+            for section, field in VOTE_SECTION_FIELDS.items():
+                names = names_by_section[section]
+                if names:
+                    logger.debug("Found %d %s (count: %d): %s", len(names), field.replace('_', '-'), counts_by_section[section], names)
         
         # Return a record if we have any vote information
-        if is_unanimous or any([ayes, noes, abstentions, recused, excused, non_voting]):
+        if is_unanimous or any(names_by_section.values()):
+            vote_fields = {}
+            for section, field in VOTE_SECTION_FIELDS.items():
+                vote_fields[field] = names_by_section[section]
+                vote_fields[f"{field}_count"] = counts_by_section[section]
             return VoteRecord(
                 item_number=item_number,
                 motion_number=motion_number,
-                motion_title=motion_title.strip(),
+                motion_title=sys.intern(motion_title.strip()),
                 motion_type=motion_type,
                 legistar_number=legistar_number,
                 legistar_link=legistar_link,
                 description=description,
                 is_unanimous=is_unanimous,
-                ayes=ayes,
-                ayes_count=ayes_count,
-                noes=noes,
-                noes_count=noes_count,
-                abstentions=abstentions,
-                abstentions_count=abstentions_count,
-                excused=excused,
-                excused_count=excused_count,
-                recused=recused,
-                recused_count=recused_count,
-                non_voting=non_voting,
-                non_voting_count=non_voting_count,
-                page_number=page_number
+                page_number=page_number,
+                **vote_fields
             )
         return None
 
-def process_single_pdf(pdf_path: str):
-    """Process a single Common Council minutes PDF."""
+DETAILED_COLUMNS = [
+    'date', 'item_number', 'motion_number', 'motion_type',
+    'legistar_number', 'member_name', 'vote_type', 'is_unanimous'
+]
+
+# Non-unanimous vote types in the detailed output, mapped to the summary
+# column holding their count and the label used in the validation report
+VOTE_TYPE_COUNT_COLUMNS = {
+    'AYE': 'total_ayes',
+    'NO': 'total_noes',
+    'ABSTAIN': 'total_abstentions',
+    'EXCUSED': 'total_excused',
+    'RECUSED': 'total_recused',
+    'NON_VOTING': 'total_non_voting'
+}
+VOTE_TYPE_LABELS = {
+    'AYE': 'Ayes',
+    'NO': 'Noes',
+    'ABSTAIN': 'Abstentions',
+    'EXCUSED': 'Excused',
+    'RECUSED': 'Recused',
+    'NON_VOTING': 'Non-voting'
+}
+
+def _add_detailed_votes(columns: Dict[str, List], vote_date: str, record: VoteRecord,
+                        names: List[str], vote_type: str, is_unanimous: bool = False):
+    """Append one detailed (per member) row for each name that cast this vote type."""
+    count = len(names)
+    columns['date'].extend([vote_date] * count)
+    columns['item_number'].extend([record.item_number] * count)
+    columns['motion_number'].extend([record.motion_number] * count)
+    columns['motion_type'].extend([record.motion_type] * count)
+    columns['legistar_number'].extend([record.legistar_number] * count)
+    columns['member_name'].extend(names)
+    columns['vote_type'].extend([vote_type] * count)
+    columns['is_unanimous'].extend([is_unanimous] * count)
+
+def _write_csv(path: str, header, rows):
+    """Write a header row and data rows to a CSV file."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def process_single_pdf(pdf_path: str, max_workers: Optional[int] = None, use_cache: bool = True):
+    """Process a single Common Council minutes PDF.
+    
+    max_workers is passed to the extractor for page text extraction; with
+    use_cache=False the on-disk page text cache is neither read nor written.
+    """
     print(f"\nProcessing single PDF: {pdf_path}")
-    extractor = CommonCouncilVoteExtractor(pdf_path)
-    vote_records = extractor.extract_votes()
+    with CommonCouncilVoteExtractor(pdf_path, max_workers=max_workers,
+                                    use_cache=use_cache) as extractor:
+        vote_records = extractor.extract_votes()
     
     if vote_records:
-        # Generate two output files - summary and detailed
-        summary_results = []
-        detailed_results = []
+        # Generate two output files - summary and detailed - each built
+        # column by column (one list per output column)
+        
+        # Summary record (one per vote)
+        summary_columns = {
+            'item_number': [record.item_number for record in vote_records],
+            'motion_number': [record.motion_number for record in vote_records],
+            'motion_title': [record.motion_title for record in vote_records],
+            'motion_type': [record.motion_type for record in vote_records],
+            'legistar_number': [record.legistar_number for record in vote_records],
+            'legistar_link': [record.legistar_link for record in vote_records],
+            'description': [record.description for record in vote_records],
+            'is_unanimous': [record.is_unanimous for record in vote_records],
+            'total_ayes': [record.ayes_count if record.ayes_count != -1 else len(record.ayes)
+                           for record in vote_records],
+            'total_noes': [record.noes_count for record in vote_records],
+            'total_abstentions': [record.abstentions_count for record in vote_records],
+            'total_excused': [record.excused_count for record in vote_records],
+            'total_recused': [record.recused_count for record in vote_records],
+            'total_non_voting': [record.non_voting_count for record in vote_records],
+            'page_number': [record.page_number for record in vote_records]
+        }
+        detailed_columns = {column: [] for column in DETAILED_COLUMNS}
+        vote_date = Path(pdf_path).stem  # Get date from filename
         
         for record in vote_records:
-            # Summary record (one per vote)
-            summary_record = {
-                'item_number': record.item_number,
-                'motion_number': record.motion_number,
-                'motion_title': record.motion_title.strip(),
-                'motion_type': record.motion_type,
-                'legistar_number': record.legistar_number,
-                'legistar_link': record.legistar_link,
-                'description': record.description.strip(),
-                'is_unanimous': record.is_unanimous,
-                'total_ayes': record.ayes_count if record.ayes_count != -1 else len(record.ayes),
-                'total_noes': record.noes_count,
-                'total_abstentions': record.abstentions_count,
-                'total_excused': record.excused_count,
-                'total_recused': record.recused_count,
-                'total_non_voting': record.non_voting_count,
-                'page_number': record.page_number
-            }
-            summary_results.append(summary_record)
-            
             # Detailed records (one per person per vote)
-            vote_date = Path(pdf_path).stem  # Get date from filename
-            
             if record.is_unanimous:
                 # For unanimous votes, we don't have individual names
                 # but we know everyone present voted aye
-                detailed_results.append({
-                    'date': vote_date,
-                    'item_number': record.item_number,
-                    'motion_number': record.motion_number,
-                    'motion_type': record.motion_type,
-                    'legistar_number': record.legistar_number,
-                    'member_name': 'ALL_PRESENT',  # Special marker for unanimous votes
-                    'vote_type': 'UNANIMOUS_AYE',
-                    'is_unanimous': True
-                })
+                # (ALL_PRESENT is a special marker for unanimous votes)
+                _add_detailed_votes(detailed_columns, vote_date, record,
+                                    ['ALL_PRESENT'], 'UNANIMOUS_AYE', is_unanimous=True)
             else:
                 # Process individual votes for non-unanimous votes
-                for name in record.ayes:
-                    if name != "UNANIMOUS":  # Skip the special unanimous marker
-                        detailed_results.append({
-                            'date': vote_date,
-                            'item_number': record.item_number,
-                            'motion_number': record.motion_number,
-                            'motion_type': record.motion_type,
-                            'legistar_number': record.legistar_number,
-                            'member_name': name.strip(),
-                            'vote_type': 'AYE',
-                            'is_unanimous': False
-                        })
-                
-                for name in record.noes:
-                    detailed_results.append({
-                        'date': vote_date,
-                        'item_number': record.item_number,
-                        'motion_number': record.motion_number,
-                        'motion_type': record.motion_type,
-                        'legistar_number': record.legistar_number,
-                        'member_name': name.strip(),
-                        'vote_type': 'NO',
-                        'is_unanimous': False
-                    })
-                
-                for name in record.abstentions:
-                    detailed_results.append({
-                        'date': vote_date,
-                        'item_number': record.item_number,
-                        'motion_number': record.motion_number,
-                        'motion_type': record.motion_type,
-                        'legistar_number': record.legistar_number,
-                        'member_name': name.strip(),
-                        'vote_type': 'ABSTAIN',
-                        'is_unanimous': False
-                    })
-                
-                for name in record.excused:
-                    detailed_results.append({
-                        'date': vote_date,
-                        'item_number': record.item_number,
-                        'motion_number': record.motion_number,
-                        'motion_type': record.motion_type,
-                        'legistar_number': record.legistar_number,
-                        'member_name': name.strip(),
-                        'vote_type': 'EXCUSED',
-                        'is_unanimous': False
-                    })
-                
-                for name in record.recused:
-                    detailed_results.append({
-                        'date': vote_date,
-                        'item_number': record.item_number,
-                        'motion_number': record.motion_number,
-                        'motion_type': record.motion_type,
-                        'legistar_number': record.legistar_number,
-                        'member_name': name.strip(),
-                        'vote_type': 'RECUSED',
-                        'is_unanimous': False
-                    })
-                
-                for name in record.non_voting:
-                    detailed_results.append({
-                        'date': vote_date,
-                        'item_number': record.item_number,
-                        'motion_number': record.motion_number,
-                        'motion_type': record.motion_type,
-                        'legistar_number': record.legistar_number,
-                        'member_name': name.strip(),
-                        'vote_type': 'NON_VOTING',
-                        'is_unanimous': False
-                    })
+                for names, vote_type in [
+                    ([name for name in record.ayes if name != "UNANIMOUS"], 'AYE'),  # Skip the special unanimous marker
+                    (record.noes, 'NO'),
+                    (record.abstentions, 'ABSTAIN'),
+                    (record.excused, 'EXCUSED'),
+                    (record.recused, 'RECUSED'),
+                    (record.non_voting, 'NON_VOTING')
+                ]:
+                    _add_detailed_votes(detailed_columns, vote_date, record, names, vote_type)
         
         # Save summary file with clean formatting
-        summary_df = pd.DataFrame(summary_results)
         summary_output = pdf_path.rsplit('.', 1)[0] + '_votes_summary.csv'
-        summary_df.to_csv(summary_output, index=False)
+        _write_csv(summary_output, summary_columns.keys(), zip(*summary_columns.values()))
         
         # Save detailed file with clean formatting
-        detailed_df = pd.DataFrame(detailed_results)
         detailed_output = pdf_path.rsplit('.', 1)[0] + '_votes_detailed.csv'
-        detailed_df.to_csv(detailed_output, index=False)
+        _write_csv(detailed_output, detailed_columns.keys(), zip(*detailed_columns.values()))
+        detailed_df = pd.DataFrame(detailed_columns)
+        detailed_df['vote_type'] = detailed_df['vote_type'].astype('category')
         
-        print(f"\nExtracted {len(summary_results)} vote records")
-        print(f"Generated {len(detailed_results)} individual vote records")
+        print(f"\nExtracted {len(vote_records)} vote records")
+        print(f"Generated {len(detailed_df)} individual vote records")
         print(f"Summary results saved to: {summary_output}")
         print(f"Detailed results saved to: {detailed_output}")
         
         # Validate vote counts
-        print("\nValidating vote counts...")
-        
-        # Print non-unanimous votes for verification
-        print("\nNon-unanimous votes found:")
-        vote_details = {}  # Store vote details for comparison
-        
-        for record in summary_results:
-            if not record['is_unanimous']:
-                vote_id = f"{record['item_number']}_{record['motion_number']}"
-                vote_sum = (
-                    record['total_ayes'] +
-                    record['total_noes'] +
-                    record['total_abstentions'] +
-                    record['total_excused'] +
-                    record['total_recused'] +
-                    record['total_non_voting']
-                )
-                
-                print(f"\nItem {record['item_number']}, Motion {record['motion_number']}:")
-                print(f"  Title: {record['motion_title']}")
-                print(f"  Ayes: {record['total_ayes']}")
-                print(f"  Noes: {record['total_noes']}")
-                print(f"  Abstentions: {record['total_abstentions']}")
-                print(f"  Excused: {record['total_excused']}")
-                print(f"  Recused: {record['total_recused']}")
-                print(f"  Non-voting: {record['total_non_voting']}")
-                print(f"  Total votes: {vote_sum}")
-                
-                vote_details[vote_id] = {
-                    'summary_total': vote_sum,
-                    'ayes': record['total_ayes'],
-                    'noes': record['total_noes'],
-                    'abstentions': record['total_abstentions'],
-                    'excused': record['total_excused'],
-                    'recused': record['total_recused'],
-                    'non_voting': record['total_non_voting']
-                }
-        
-        print(f"\nFound {len([r for r in summary_results if r['is_unanimous']])} unanimous votes and {len([r for r in summary_results if not r['is_unanimous']])} non-unanimous votes")
+        vote_types = list(VOTE_TYPE_COUNT_COLUMNS)
+        count_columns = list(VOTE_TYPE_COUNT_COLUMNS.values())
+        labels = list(VOTE_TYPE_LABELS.values())
+        # Counts are at most the size of the council, so int16 is plenty
+        summary_df = pd.DataFrame(summary_columns).astype({column: 'int16' for column in count_columns})
+        summary_df['vote_sum'] = summary_df[count_columns].sum(axis=1)
+        non_unanimous_summary = summary_df[~summary_df['is_unanimous']]
         
         # Count non-unanimous votes in detailed
-        non_unanimous_votes = [vote for vote in detailed_results if not vote['is_unanimous']]
+        non_unanimous_votes = detailed_df[~detailed_df['is_unanimous']]
         
         # Group detailed votes by item and motion
-        detailed_vote_counts = {}
-        for vote in non_unanimous_votes:
-            vote_id = f"{vote['item_number']}_{vote['motion_number']}"
-            if vote_id not in detailed_vote_counts:
-                detailed_vote_counts[vote_id] = {'AYE': 0, 'NO': 0, 'ABSTAIN': 0, 'EXCUSED': 0, 'RECUSED': 0, 'NON_VOTING': 0}
-            detailed_vote_counts[vote_id][vote['vote_type']] += 1
+        detailed_pivot = non_unanimous_votes.pivot_table(
+            index=['item_number', 'motion_number'], columns='vote_type',
+            aggfunc='size', fill_value=0, observed=True
+        ).reindex(columns=vote_types, fill_value=0)
+        
+        # Line up summary and detailed counts per vote; a vote listed twice in
+        # the summary is compared using its last entry
+        summary_counts = non_unanimous_summary.drop_duplicates(
+            ['item_number', 'motion_number'], keep='last'
+        )[['item_number', 'motion_number', *count_columns]]
+        summary_counts.columns = ['item_number', 'motion_number', *vote_types]
+        comparison = summary_counts.merge(
+            detailed_pivot.reset_index(), on=['item_number', 'motion_number'],
+            how='outer', suffixes=('_sum', '_det'), indicator='source'
+        )
+        summary_count_columns = [f"{vote_type}_sum" for vote_type in vote_types]
+        detailed_count_columns = [f"{vote_type}_det" for vote_type in vote_types]
+        comparison[summary_count_columns + detailed_count_columns] = (
+            comparison[summary_count_columns + detailed_count_columns].fillna(0).astype(int)
+        )
+        comparison['summary_total'] = comparison[summary_count_columns].sum(axis=1)
+        comparison['detailed_total'] = comparison[detailed_count_columns].sum(axis=1)
+        comparison['in_summary'] = comparison['source'] != 'right_only'
+        comparison['in_detailed'] = comparison['source'] != 'left_only'
+        comparison['mismatch'] = (
+            comparison['in_summary'] & comparison['in_detailed']
+            & (comparison['summary_total'] != comparison['detailed_total'])
+        )
         
-        # Compare vote counts for each item
-        print("\nDetailed vote count comparison:")
-        total_non_unanimous_in_summary = 0
-        total_non_unanimous_in_detailed = 0
+        total_non_unanimous_in_summary = comparison.loc[comparison['in_summary'], 'summary_total'].sum()
+        total_non_unanimous_in_detailed = comparison.loc[comparison['in_detailed'], 'detailed_total'].sum()
         
-        for vote_id in sorted(set(vote_details.keys()) | set(detailed_vote_counts.keys())):
-            print(f"\nVote {vote_id}:")
-            if vote_id in vote_details:
-                summary = vote_details[vote_id]
-                print("Summary counts:")
-                print(f"  Ayes: {summary['ayes']}")
-                print(f"  Noes: {summary['noes']}")
-                print(f"  Abstentions: {summary['abstentions']}")
-                print(f"  Excused: {summary['excused']}")
-                print(f"  Recused: {summary['recused']}")
-                print(f"  Non-voting: {summary['non_voting']}")
-                print(f"  Total: {summary['summary_total']}")
-                total_non_unanimous_in_summary += summary['summary_total']
+        # The full report is only built when DEBUG logging is on; otherwise
+        # just the final match/mismatch result is printed. Report lines are
+        # collected and logged as one message.
+        verbose = logger.isEnabledFor(logging.DEBUG)
+        if verbose:
+            report = ["\nValidating vote counts..."]
             
-            if vote_id in detailed_vote_counts:
-                detailed = detailed_vote_counts[vote_id]
-                print("Detailed counts:")
-                print(f"  Ayes: {detailed['AYE']}")
-                print(f"  Noes: {detailed['NO']}")
-                print(f"  Abstentions: {detailed['ABSTAIN']}")
-                print(f"  Excused: {detailed['EXCUSED']}")
-                print(f"  Recused: {detailed['RECUSED']}")
-                print(f"  Non-voting: {detailed['NON_VOTING']}")
-                detailed_total = sum(detailed.values())
-                print(f"  Total: {detailed_total}")
-                total_non_unanimous_in_detailed += detailed_total
+            # Print non-unanimous votes for verification
+            report.append("\nNon-unanimous votes found:")
+            for record in non_unanimous_summary.itertuples(index=False):
+                report.append(f"\nItem {record.item_number}, Motion {record.motion_number}:")
+                report.append(f"  Title: {record.motion_title}")
+                for label, column in zip(labels, count_columns):
+                    report.append(f"  {label}: {getattr(record, column)}")
+                report.append(f"  Total votes: {record.vote_sum}")
             
-            if vote_id in vote_details and vote_id in detailed_vote_counts:
-                summary_total = vote_details[vote_id]['summary_total']
-                detailed_total = sum(detailed_vote_counts[vote_id].values())
-                if summary_total != detailed_total:
-                    print(f"⚠ Mismatch for vote {vote_id}: Summary={summary_total}, Detailed={detailed_total}")
-                    print("  Differences:")
-                    if vote_details[vote_id]['ayes'] != detailed_vote_counts[vote_id]['AYE']:
-                        print(f"    Ayes: Summary={vote_details[vote_id]['ayes']}, Detailed={detailed_vote_counts[vote_id]['AYE']}")
-                    if vote_details[vote_id]['noes'] != detailed_vote_counts[vote_id]['NO']:
-                        print(f"    Noes: Summary={vote_details[vote_id]['noes']}, Detailed={detailed_vote_counts[vote_id]['NO']}")
-                    if vote_details[vote_id]['abstentions'] != detailed_vote_counts[vote_id]['ABSTAIN']:
-                        print(f"    Abstentions: Summary={vote_details[vote_id]['abstentions']}, Detailed={detailed_vote_counts[vote_id]['ABSTAIN']}")
-                    if vote_details[vote_id]['excused'] != detailed_vote_counts[vote_id]['EXCUSED']:
-                        print(f"    Excused: Summary={vote_details[vote_id]['excused']}, Detailed={detailed_vote_counts[vote_id]['EXCUSED']}")
-                    if vote_details[vote_id]['recused'] != detailed_vote_counts[vote_id]['RECUSED']:
-                        print(f"    Recused: Summary={vote_details[vote_id]['recused']}, Detailed={detailed_vote_counts[vote_id]['RECUSED']}")
-                    if vote_details[vote_id]['non_voting'] != detailed_vote_counts[vote_id]['NON_VOTING']:
-                        print(f"    Non-voting: Summary={vote_details[vote_id]['non_voting']}, Detailed={detailed_vote_counts[vote_id]['NON_VOTING']}")
-        
-        print(f"\nVote count validation (non-unanimous votes only):")
-        print(f"Total non-unanimous votes in summary file: {total_non_unanimous_in_summary}")
-        print(f"Total non-unanimous votes in detailed file: {total_non_unanimous_in_detailed}")
+            unanimous_count = int(summary_df['is_unanimous'].sum())
+            report.append(f"\nFound {unanimous_count} unanimous votes and {len(summary_df) - unanimous_count} non-unanimous votes")
+            
+            # Compare vote counts for each item
+            report.append("\nDetailed vote count comparison:")
+            comparison['vote_id'] = comparison['item_number'] + '_' + comparison['motion_number']
+            for vote in comparison.sort_values('vote_id').to_dict('records'):
+                report.append(f"\nVote {vote['vote_id']}:")
+                if vote['in_summary']:
+                    report.append("Summary counts:")
+                    for label, column in zip(labels, summary_count_columns):
+                        report.append(f"  {label}: {vote[column]}")
+                    report.append(f"  Total: {vote['summary_total']}")
+                
+                if vote['in_detailed']:
+                    report.append("Detailed counts:")
+                    for label, column in zip(labels, detailed_count_columns):
+                        report.append(f"  {label}: {vote[column]}")
+                    report.append(f"  Total: {vote['detailed_total']}")
+                
+                if vote['mismatch']:
+                    report.append(f"⚠ Mismatch for vote {vote['vote_id']}: Summary={vote['summary_total']}, Detailed={vote['detailed_total']}")
+                    report.append("  Differences:")
+                    for label, summary_column, detailed_column in zip(labels, summary_count_columns, detailed_count_columns):
+                        if vote[summary_column] != vote[detailed_column]:
+                            report.append(f"    {label}: Summary={vote[summary_column]}, Detailed={vote[detailed_column]}")
+            
+            report.append(f"\nVote count validation (non-unanimous votes only):")
+            report.append(f"Total non-unanimous votes in summary file: {total_non_unanimous_in_summary}")
+            report.append(f"Total non-unanimous votes in detailed file: {total_non_unanimous_in_detailed}")
+            logger.debug("%s", "\n".join(report))
         
         if total_non_unanimous_in_summary == total_non_unanimous_in_detailed:
             print("✓ Non-unanimous vote counts match!")
@@ -734,18 +719,19 @@ def process_single_pdf(pdf_path: str):
             print("⚠ Warning: Non-unanimous vote counts don't match!")
             print(f"   Difference: {abs(total_non_unanimous_in_summary - total_non_unanimous_in_detailed)} votes")
             
-            # Print detailed breakdown of non-unanimous votes for debugging
-            print("\nDetailed breakdown of non-unanimous votes:")
-            vote_types = {}
-            for vote in non_unanimous_votes:
-                vote_type = vote['vote_type']
-                vote_types[vote_type] = vote_types.get(vote_type, 0) + 1
-            for vote_type, count in sorted(vote_types.items()):
-                print(f"{vote_type}: {count} votes")
+            if verbose:
+                # Log detailed breakdown of non-unanimous votes for debugging
+                logger.debug("\nDetailed breakdown of non-unanimous votes:")
+                vote_type_counts = non_unanimous_votes['vote_type'].value_counts().sort_index()
+                for vote_type, count in vote_type_counts[vote_type_counts > 0].items():
+                    logger.debug("%s: %d votes", vote_type, count)
     else:
         print("No vote records found")
 
 if __name__ == "__main__":
+    # Per-page and per-section extraction details are logged at DEBUG
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Test with a single recent Common Council PDF
     test_pdf = "downloaded_minutes/COMMON_COUNCIL/2025-05-06.pdf"
     process_single_pdf(test_pdf) 
\ No newline at end of file
@@ -1,17 +1,28 @@
 import re
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "https://webapi.legistar.com/v1/madison"
 COMMON_COUNCIL_BODY_ID = 1
+DISTRICT_EMAIL_RE = re.compile(r'district(\d+)@')
+REQUEST_TIMEOUT = 30  # seconds
+FETCH_WORKERS = 8  # Concurrent per-person requests; kept small to be polite to Legistar
+COMMITTEE_COLUMNS = ['person_id', 'body_id', 'body_name', 'member_type', 'title', 'start_date', 'end_date']
+
+# One session for all API calls so connections are reused, with a pool
+# large enough for every fetch worker
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS))
 
 
 def extract_district(email, sort_value):
     """Extract district number from email or sort value."""
     # Try email first (e.g., district3@cityofmadison.com)
     if email:
-        match = re.search(r'district(\d+)@', email)
+        match = DISTRICT_EMAIL_RE.search(email)
         if match:
             return int(match.group(1))
 
@@ -21,12 +32,20 @@ def extract_district(email, sort_value):
 
     return None
 
+def parse_api_dates(values):
+    """Convert Legistar ISO 8601 timestamps (e.g. 2024-04-16T00:00:00) to dates.
+
+    Only the YYYY-MM-DD prefix is parsed, with an explicit format so pandas
+    skips format inference. Out-of-bounds dates like 9999-12-31 become NaT.
+    """
+    return pd.to_datetime(values.str.slice(0, 10), format='%Y-%m-%d', errors='coerce').dt.date
+
 def fetch_office_records():
     """Fetch all office records for the Common Council."""
     url = f"{BASE_URL}/bodies/{COMMON_COUNCIL_BODY_ID}/OfficeRecords"
 
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -38,7 +57,7 @@ def fetch_persons():
     url = f"{BASE_URL}/persons"
 
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -51,7 +70,7 @@ def fetch_person_office_records(person_id):
     url = f"{BASE_URL}/persons/{person_id}/OfficeRecords"
 
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -76,39 +95,35 @@ def process_alders():
         persons_dict = {p['PersonId']: p for p in persons}
         print(f"Found {len(persons)} person records")
 
-    # Process into a clean dataframe
-    records = []
-    for rec in office_records:
-        person_id = rec.get('OfficeRecordPersonId')
-        person = persons_dict.get(person_id, {})
-        email = rec.get('OfficeRecordEmail') or person.get('PersonEmail')
-        sort_value = rec.get('OfficeRecordSort')
-
-        records.append({
-            'person_id': person_id,
-            'full_name': rec.get('OfficeRecordFullName'),
-            'first_name': rec.get('OfficeRecordFirstName'),
-            'last_name': rec.get('OfficeRecordLastName'),
-            'district': extract_district(email, sort_value),
-            'member_type': rec.get('OfficeRecordMemberType'),
-            'start_date': rec.get('OfficeRecordStartDate'),
-            'end_date': rec.get('OfficeRecordEndDate'),
-            'email': email,
-            'extra_text': rec.get('OfficeRecordExtraText'),
-            # Additional person details
-            'address': person.get('PersonAddress1'),
-            'city': person.get('PersonCity1'),
-            'state': person.get('PersonState1'),
-            'zip': person.get('PersonZip1'),
-            'phone': person.get('PersonPhone'),
-            'website': person.get('PersonWWW'),
-        })
-
-    df = pd.DataFrame(records)
+    # Process into a clean dataframe, built column by column
+    people = [persons_dict.get(rec.get('OfficeRecordPersonId'), {}) for rec in office_records]
+    emails = [rec.get('OfficeRecordEmail') or person.get('PersonEmail')
+              for rec, person in zip(office_records, people)]
+
+    df = pd.DataFrame({
+        'person_id': [rec.get('OfficeRecordPersonId') for rec in office_records],
+        'full_name': [rec.get('OfficeRecordFullName') for rec in office_records],
+        'first_name': [rec.get('OfficeRecordFirstName') for rec in office_records],
+        'last_name': [rec.get('OfficeRecordLastName') for rec in office_records],
+        'district': [extract_district(email, rec.get('OfficeRecordSort'))
+                     for rec, email in zip(office_records, emails)],
+        'member_type': [rec.get('OfficeRecordMemberType') for rec in office_records],
+        'start_date': [rec.get('OfficeRecordStartDate') for rec in office_records],
+        'end_date': [rec.get('OfficeRecordEndDate') for rec in office_records],
+        'email': emails,
+        'extra_text': [rec.get('OfficeRecordExtraText') for rec in office_records],
+        # Additional person details
+        'address': [person.get('PersonAddress1') for person in people],
+        'city': [person.get('PersonCity1') for person in people],
+        'state': [person.get('PersonState1') for person in people],
+        'zip': [person.get('PersonZip1') for person in people],
+        'phone': [person.get('PersonPhone') for person in people],
+        'website': [person.get('PersonWWW') for person in people],
+    })
 
     # Clean up dates
-    df['start_date'] = pd.to_datetime(df['start_date']).dt.date
-    df['end_date'] = pd.to_datetime(df['end_date']).dt.date
+    df['start_date'] = parse_api_dates(df['start_date'])
+    df['end_date'] = parse_api_dates(df['end_date'])
 
     return df
 
@@ -118,38 +133,39 @@ def process_committees(alders_df):
     person_ids = alders_df['person_id'].unique()
     print(f"\nFetching committee memberships for {len(person_ids)} persons...")
 
-    records = []
-    for i, person_id in enumerate(person_ids):
-        if (i + 1) % 20 == 0:
-            print(f"  Progress: {i + 1}/{len(person_ids)}")
+    # One list per output column
+    columns = {name: [] for name in COMMITTEE_COLUMNS}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        # Requests overlap across workers; results come back in person order
+        results = executor.map(fetch_person_office_records, person_ids)
+        for i, (person_id, office_records) in enumerate(zip(person_ids, results)):
+            if (i + 1) % 20 == 0:
+                print(f"  Progress: {i + 1}/{len(person_ids)}")
 
-        office_records = fetch_person_office_records(person_id)
-        if not office_records:
-            continue
-
-        for rec in office_records:
-            # Skip Common Council itself (we already have that in alders table)
-            if rec.get('OfficeRecordBodyId') == COMMON_COUNCIL_BODY_ID:
+            if not office_records:
                 continue
 
-            records.append({
-                'person_id': person_id,
-                'body_id': rec.get('OfficeRecordBodyId'),
-                'body_name': rec.get('OfficeRecordBodyName'),
-                'member_type': rec.get('OfficeRecordMemberType'),
-                'title': rec.get('OfficeRecordTitle'),
-                'start_date': rec.get('OfficeRecordStartDate'),
-                'end_date': rec.get('OfficeRecordEndDate'),
-            })
-
-    if not records:
+            for rec in office_records:
+                # Skip Common Council itself (we already have that in alders table)
+                if rec.get('OfficeRecordBodyId') == COMMON_COUNCIL_BODY_ID:
+                    continue
+
+                columns['person_id'].append(person_id)
+                columns['body_id'].append(rec.get('OfficeRecordBodyId'))
+                columns['body_name'].append(rec.get('OfficeRecordBodyName'))
+                columns['member_type'].append(rec.get('OfficeRecordMemberType'))
+                columns['title'].append(rec.get('OfficeRecordTitle'))
+                columns['start_date'].append(rec.get('OfficeRecordStartDate'))
+                columns['end_date'].append(rec.get('OfficeRecordEndDate'))
+
+    if not columns['person_id']:
         return None
 
-    df = pd.DataFrame(records)
+    df = pd.DataFrame(columns)
 
     # Clean up dates (handle out-of-bounds dates like 9999-12-31)
-    df['start_date'] = pd.to_datetime(df['start_date'], errors='coerce').dt.date
-    df['end_date'] = pd.to_datetime(df['end_date'], errors='coerce').dt.date
+    df['start_date'] = parse_api_dates(df['start_date'])
+    df['end_date'] = parse_api_dates(df['end_date'])
 
     return df
 
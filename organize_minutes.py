@@ -3,6 +3,9 @@ import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+# Pattern to match date and meeting type: YYYY-MM-DD_MEETING_TYPE
+MINUTES_FILENAME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})_(.*?)_minutes\.pdf")
+
 def organize_minutes(dry_run: bool = False) -> Tuple[Dict[str, int], List[str]]:
     """
     Organize meeting minutes PDFs by:
@@ -33,30 +36,29 @@ def organize_minutes(dry_run: bool = False) -> Tuple[Dict[str, int], List[str]]:
     
     # Step 1: Replace spaces with underscores in root directory only
     print("\nStep 1: Replacing spaces with underscores in root directory...")
-    for file_path in minutes_dir.glob("*"):
-        if file_path.is_file() and " " in file_path.name:
-            stats["files_found"] += 1
-            try:
-                new_name = file_path.name.replace(" ", "_")
-                new_path = file_path.parent / new_name
-                
-                if not dry_run:
-                    file_path.rename(new_path)
-                print(f"Renamed: {file_path.name} -> {new_name}")
-                stats["files_renamed"] += 1
-            except Exception as e:
-                error_msg = f"Error renaming {file_path.name}: {e}"
-                print(error_msg)
-                errors.append(error_msg)
-                stats["errors"] += 1
+    with os.scandir(minutes_dir) as it:
+        entries = [entry for entry in it if entry.is_file() and " " in entry.name]
+    for entry in entries:
+        stats["files_found"] += 1
+        try:
+            new_name = entry.name.replace(" ", "_")
+            
+            if not dry_run:
+                os.rename(entry.path, os.path.join(minutes_dir, new_name))
+            print(f"Renamed: {entry.name} -> {new_name}")
+            stats["files_renamed"] += 1
+        except Exception as e:
+            error_msg = f"Error renaming {entry.name}: {e}"
+            print(error_msg)
+            errors.append(error_msg)
+            stats["errors"] += 1
     
     # Step 2: Organize files into meeting-type folders
     print("\nStep 2: Organizing files into meeting-type folders...")
-    # Pattern to match date and meeting type: YYYY-MM-DD_MEETING_TYPE
-    pattern = r"(\d{4}-\d{2}-\d{2})_(.*?)_minutes\.pdf"
     
-    # Get all PDF files in the root minutes directory
-    pdf_files = list(minutes_dir.glob("*.pdf"))
+    # Get all PDF files in the root minutes directory (rescanned, since step 1 renamed files)
+    with os.scandir(minutes_dir) as it:
+        pdf_files = [entry for entry in it if entry.name.endswith(".pdf")]
     stats["files_found"] = len(pdf_files)
     
     if not pdf_files:
@@ -65,37 +67,37 @@ def organize_minutes(dry_run: bool = False) -> Tuple[Dict[str, int], List[str]]:
     
     print(f"Found {len(pdf_files)} PDF files to organize")
     
-    for pdf_path in pdf_files:
+    for pdf_entry in pdf_files:
         try:
-            match = re.match(pattern, pdf_path.name)
+            match = MINUTES_FILENAME_RE.match(pdf_entry.name)
             if match:
                 date, meeting_type = match.groups()
                 
                 # Clean up meeting type and create folder name
                 meeting_folder = meeting_type.replace(' ', '_')
-                folder_path = minutes_dir / meeting_folder
+                folder_path = os.path.join(minutes_dir, meeting_folder)
                 
                 # Create folder if it doesn't exist
                 if not dry_run:
-                    folder_path.mkdir(exist_ok=True)
+                    os.makedirs(folder_path, exist_ok=True)
                 
                 # Create new filename: YYYY-MM-DD.pdf
                 new_filename = f"{date}.pdf"
-                new_path = folder_path / new_filename
+                new_path = os.path.join(folder_path, new_filename)
                 
                 # Move and rename file
                 if not dry_run:
-                    pdf_path.rename(new_path)
-                print(f"Organized: {pdf_path.name} -> {meeting_folder}/{new_filename}")
+                    os.rename(pdf_entry.path, new_path)
+                print(f"Organized: {pdf_entry.name} -> {meeting_folder}/{new_filename}")
                 stats["files_organized"] += 1
             else:
-                error_msg = f"Warning: Couldn't parse filename pattern for {pdf_path.name}"
+                error_msg = f"Warning: Couldn't parse filename pattern for {pdf_entry.name}"
                 print(error_msg)
                 errors.append(error_msg)
                 stats["errors"] += 1
                 
         except Exception as e:
-            error_msg = f"Error processing {pdf_path.name}: {e}"
+            error_msg = f"Error processing {pdf_entry.name}: {e}"
             print(error_msg)
             errors.append(error_msg)
             stats["errors"] += 1
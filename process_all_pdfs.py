@@ -1,30 +1,108 @@
+import argparse
+import contextlib
+import io
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Optional, Tuple
 from extract_votes import process_single_pdf
 
-def process_all_pdfs():
-    """Process all PDFs in the downloaded_minutes/COMMON_COUNCIL directory."""
+@contextlib.contextmanager
+def _capture_extract_logs(output: io.StringIO):
+    """Send extract_votes log records to output instead of the console."""
+    extract_logger = logging.getLogger("extract_votes")
+    handler = logging.StreamHandler(output)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    propagate = extract_logger.propagate
+    extract_logger.addHandler(handler)
+    extract_logger.propagate = False
+    try:
+        yield
+    finally:
+        extract_logger.removeHandler(handler)
+        extract_logger.propagate = propagate
+
+def _process_pdf(pdf_file: Path, page_workers: Optional[int] = None,
+                 use_cache: bool = True) -> Optional[str]:
+    """Process one PDF, returning the error message if it failed."""
+    try:
+        process_single_pdf(str(pdf_file), max_workers=page_workers, use_cache=use_cache)
+    except Exception as e:
+        return str(e)
+    return None
+
+def _process_pdf_captured(pdf_file: Path, page_workers: Optional[int] = None,
+                          use_cache: bool = True) -> Tuple[str, Optional[str]]:
+    """Process one PDF in a worker process, returning its output and error message.
+    
+    Both printed output and extract_votes log records are captured, so each
+    PDF's lines stay together when PDFs are processed in parallel.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), _capture_extract_logs(output):
+        error = _process_pdf(pdf_file, page_workers, use_cache)
+    return output.getvalue(), error
+
+def _print_header(i: int, total: int, pdf_file: Path):
+    """Print the banner that starts a PDF's block of output."""
+    print(f"\n{'='*80}")
+    print(f"Processing PDF {i}/{total}: {pdf_file}")
+    print('='*80)
+
+def _print_outcome(pdf_file: Path, error: Optional[str]):
+    """Print the line that ends a PDF's block of output."""
+    if error is not None:
+        print(f"Error processing {pdf_file}: {error}")
+    else:
+        print(f"\nCompleted processing {pdf_file}")
+
+def process_all_pdfs(max_workers: Optional[int] = None, use_cache: bool = True):
+    """Process all PDFs in the downloaded_minutes/COMMON_COUNCIL directory.
+    
+    PDFs are independent, so they are processed in parallel across
+    max_workers processes (default: one per CPU). use_cache=False re-extracts page text instead of reading each PDF's
+    cached text.
+    """
     # Get the directory containing the PDFs
     pdf_dir = Path("downloaded_minutes/COMMON_COUNCIL")
     
-    # Get all PDF files
-    pdf_files = sorted([f for f in pdf_dir.glob("*.pdf")])
+    # Get all PDF files; the list is kept (rather than streamed to the
+    # workers) because progress output needs the total
+    pdf_files = sorted(pdf_dir.glob("*.pdf"))
     
     print(f"\nFound {len(pdf_files)} PDF files to process")
     
-    # Process each PDF
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"\n{'='*80}")
-        print(f"Processing PDF {i}/{len(pdf_files)}: {pdf_file}")
-        print('='*80)
-        
-        try:
-            process_single_pdf(str(pdf_file))
-        except Exception as e:
-            print(f"Error processing {pdf_file}: {e}")
-            continue
-        
-        print(f"\nCompleted processing {pdf_file}")
+    workers = min(max_workers or os.cpu_count() or 1, len(pdf_files))
+    if workers > 1:
+        # Each worker reads its PDF's pages serially to avoid nested process
+        # pools. Output is captured per PDF and printed in file order.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_process_pdf_captured, pdf_file, 1, use_cache)
+                       for pdf_file in pdf_files]
+            for i, (pdf_file, future) in enumerate(zip(pdf_files, futures), 1):
+                try:
+                    output, error = future.result()
+                except BrokenProcessPool as e:
+                    # A worker died (e.g. killed for memory); this PDF and any
+                    # not yet finished fail, but finished results are kept
+                    output, error = "", f"worker process died: {e}"
+                _print_header(i, len(pdf_files), pdf_file)
+                print(output, end='')
+                _print_outcome(pdf_file, error)
+    else:
+        # Output streams straight to the console as each PDF is processed
+        for i, pdf_file in enumerate(pdf_files, 1):
+            _print_header(i, len(pdf_files), pdf_file)
+            _print_outcome(pdf_file, _process_pdf(pdf_file, use_cache=use_cache))
 
 if __name__ == "__main__":
-    process_all_pdfs() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Extract votes from all Common Council minutes PDFs")
+    parser.add_argument("--no-cache", action="store_true",
+                      help="Re-extract PDF text instead of using cached page text")
+    args = parser.parse_args()
+    
+    # Per-page and per-section extraction details are logged at DEBUG
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    process_all_pdfs(use_cache=not args.no_cache)
@@ -1,30 +1,48 @@
+import threading
 import duckdb
 import pandas as pd
 import streamlit as st
 from pathlib import Path
 
+CUSTOM_QUERY_TIMEOUT = 30  # seconds before a custom query is interrupted
+MEMORY_LIMIT = '2GB'  # DuckDB memory limit for the app's queries
+
 def run_web_interface():
     """Run the Streamlit web interface"""
     st.set_page_config(page_title="Madison City Council Votes", layout="wide")
     st.title("Madison City Council Votes Explorer")
 
-    # Initialize database connection
+    # Initialize database connection. The app only reads, so open the file
+    # read-only; custom queries can't modify it either.
     @st.cache_resource
     def init_connection():
-        return duckdb.connect('madison_votes.db')
+        db = duckdb.connect('madison_votes.db', read_only=True)
+        db.execute(f"SET memory_limit='{MEMORY_LIMIT}'")
+        return db
 
     db = init_connection()
 
+    # The vote tables only change when combine_and_load.py runs, so cache
+    # query results across reruns (every widget interaction) for a few minutes.
+    # The connection is passed as _db so Streamlit doesn't try to hash it.
+    # Results are Arrow tables, which st.dataframe displays without a pandas
+    # conversion (pyarrow is a Streamlit dependency). Queries run on their own
+    # cursor because the shared connection is used by every browser session.
+    @st.cache_data(ttl=300)
+    def run_cached_query(_db, query, params=None):
+        with _db.cursor() as cursor:
+            return cursor.execute(query, params).arrow()
+
     # Sidebar with quick stats
     with st.sidebar:
         st.header("Quick Stats")
-        stats = db.execute("""
+        stats = run_cached_query(db, """
             SELECT 
                 COUNT(DISTINCT meeting_date) as total_meetings,
                 COUNT(*) as total_votes,
-                SUM(CASE WHEN NOT is_unanimous THEN 1 ELSE 0 END) as non_unanimous_votes
+                COUNT(*) FILTER (WHERE NOT is_unanimous) as non_unanimous_votes
             FROM votes_summary
-        """).fetch_df().iloc[0]
+        """).to_pylist()[0]
         
         st.metric("Total Meetings", stats['total_meetings'])
         st.metric("Total Votes", stats['total_votes'])
@@ -41,50 +59,72 @@ def run_web_interface():
         )
 
         if view_choice == "Votes with Member Voting Records":
-            st.dataframe(db.execute("""
-                SELECT * FROM votes_with_voters
-                WHERE is_unanimous = FALSE
-            """).fetch_df())
+            # Page through the votes rather than sending every row to the
+            # browser, selecting only the displayed columns (is_unanimous is
+            # always FALSE here)
+            col1, col2 = st.columns(2)
+            page_size = col1.number_input("Rows per page", min_value=10, max_value=1000, value=100, step=10)
+            page_count = max(1, -(-int(stats['non_unanimous_votes']) // page_size))
+            page = col2.number_input("Page", min_value=1, max_value=page_count, value=1)
+            st.caption(f"Page {page} of {page_count} ({stats['non_unanimous_votes']} non-unanimous votes)")
+            st.dataframe(run_cached_query(db, """
+                SELECT 
+                    meeting_date, item_number, motion_number, motion_title, motion_type,
+                    legistar_number, legistar_link, description,
+                    total_ayes, total_noes, total_abstentions, total_excused,
+                    total_recused, total_non_voting, page_number,
+                    ayes_list, noes_list, abstentions_list, excused_list,
+                    recused_list, non_voting_list
+                FROM votes_with_voters
+                WHERE NOT is_unanimous
+                ORDER BY meeting_date DESC, item_number, motion_number
+                LIMIT ? OFFSET ?
+            """, (page_size, (page - 1) * page_size)))
 
         elif view_choice == "Member Voting Patterns":
-            st.dataframe(db.execute("""
+            st.dataframe(run_cached_query(db, """
                 SELECT * FROM member_voting_patterns
                 ORDER BY member_name, vote_count DESC
-            """).fetch_df())
+            """))
 
         elif view_choice == "Most Active Voters":
-            st.dataframe(db.execute("""
-                SELECT 
-                    member_name, 
-                    COUNT(*) as vote_count,
-                    COUNT(DISTINCT meeting_date) as meetings_attended
-                FROM votes_detailed 
-                GROUP BY member_name 
+            st.dataframe(run_cached_query(db, """
+                SELECT * FROM most_active_voters
                 ORDER BY vote_count DESC
-            """).fetch_df())
+            """))
 
     with tab2:
         st.header("Custom SQL Query")
         query = st.text_area("Enter your SQL query:", height=150)
         if st.button("Run Query"):
             try:
-                results = db.execute(query).fetch_df()
+                with db.cursor() as cursor:
+                    # DuckDB has no statement timeout setting, so interrupt
+                    # the cursor from a timer if the query runs too long
+                    timer = threading.Timer(CUSTOM_QUERY_TIMEOUT, cursor.interrupt)
+                    timer.start()
+                    try:
+                        results = cursor.execute(query).arrow()
+                    finally:
+                        timer.cancel()
                 st.dataframe(results)
             except Exception as e:
                 st.error(f"Error executing query: {e}")
 
     with tab3:
         st.header("Database Schema")
-        tables = db.execute("""
-            SELECT table_name, table_type 
-            FROM information_schema.tables 
-            WHERE table_schema = 'main'
-        """).fetch_df()
+        # Every table's columns in one query, split into one listing per table
+        columns = run_cached_query(db, """
+            SELECT t.table_name, t.table_type, c.column_name, c.data_type, c.is_nullable
+            FROM information_schema.tables t
+            JOIN information_schema.columns c USING (table_schema, table_name)
+            WHERE t.table_schema = 'main'
+            ORDER BY t.table_name, c.ordinal_position
+        """).to_pandas()
         
-        for _, row in tables.iterrows():
-            st.subheader(f"{row['table_name']} ({row['table_type']})")
-            schema = db.execute(f"DESCRIBE {row['table_name']}").fetch_df()
-            st.dataframe(schema)
+        for (table_name, table_type), schema in columns.groupby(['table_name', 'table_type'], sort=False):
+            st.subheader(f"{table_name} ({table_type})")
+            st.dataframe(schema[['column_name', 'data_type', 'is_nullable']], hide_index=True)
 
 if __name__ == "__main__":
     run_web_interface() 
\ No newline at end of file
@@ -1,65 +1,136 @@
 import os
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from itertools import repeat
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 import json
 import argparse
 
+REQUEST_TIMEOUT = 30  # seconds
+DOWNLOAD_WORKERS = 8  # Concurrent downloads; kept small to be polite to Legistar
+DOWNLOAD_CHUNK_SIZE = 128 * 1024  # bytes per read when streaming a PDF to disk
+EVENTS_PAGE_SIZE = 1000  # Most events the Legistar API returns per request
+EVENT_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}')  # Legistar's EventDate format
+
 class MadisonLegistarScraper:
     def __init__(self):
         self.base_url = "https://webapi.legistar.com/v1/madison"
         self.events_url = f"{self.base_url}/events"
         self.output_dir = "downloaded_minutes"
         
+        # One session for all requests so connections are reused, with a pool
+        # large enough for every download worker
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=DOWNLOAD_WORKERS,
+                                                   pool_maxsize=DOWNLOAD_WORKERS))
+        
         # Create output directory if it doesn't exist
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
     
-    def fetch_events(self, start_date=None, end_date=None):
+    def iter_events(self, start_date=None, end_date=None):
         """
-        Fetch events from the Legistar API with optional date filtering
+        Yield events from the Legistar API with optional date filtering,
+        requesting them a page at a time
         """
-        params = {}
+        # The API returns at most EVENTS_PAGE_SIZE events per request, so page
+        # with $top/$skip in a stable order
+        params = {'$orderby': 'EventDate,EventId', '$top': EVENTS_PAGE_SIZE}
         if start_date:
             params['$filter'] = f"EventDate ge datetime'{start_date}'"
             if end_date:
                 params['$filter'] += f" and EventDate le datetime'{end_date}'"
         
-        try:
-            response = requests.get(self.events_url, params=params)
+        skip = 0
+        while True:
+            params['$skip'] = skip
+            response = self.session.get(self.events_url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            page = response.json()
+            yield from page
+            if len(page) < EVENTS_PAGE_SIZE:
+                return
+            skip += len(page)
+    
+    def fetch_events(self, start_date=None, end_date=None):
+        """
+        Fetch events from the Legistar API with optional date filtering
+        """
+        try:
+            return list(self.iter_events(start_date=start_date, end_date=end_date))
         except requests.exceptions.RequestException as e:
             print(f"Error fetching events: {e}")
             return None
     
-    def download_minutes(self, event):
+    def minutes_filename(self, event):
+        """
+        Name of the file an event's minutes are saved to
+        """
+        event_date = event['EventDate']
+        if EVENT_DATE_RE.fullmatch(event_date):
+            # Zero-padded ISO 8601, so the date is the first 10 characters
+            event_date = event_date[:10]
+        else:
+            event_date = datetime.strptime(event_date, "%Y-%m-%dT%H:%M:%S").strftime('%Y-%m-%d')
+        committee_name = event['EventBodyName'].replace('/', '_').replace('\\', '_')
+        return f"{event_date}_{committee_name}_minutes.pdf"
+    
+    def download_minutes(self, event, revalidate=False):
         """
         Download minutes file for a given event if available
+
+        Existing files are skipped, or with revalidate=True re-downloaded only
+        if the server reports the minutes changed since they were saved.
         """
         if not event.get('EventMinutesFile'):
             return False
         
         file_url = event['EventMinutesFile']
-        event_date = datetime.strptime(event['EventDate'], "%Y-%m-%dT%H:%M:%S")
-        committee_name = event['EventBodyName'].replace('/', '_').replace('\\', '_')
-        
-        filename = f"{event_date.strftime('%Y-%m-%d')}_{committee_name}_minutes.pdf"
+        filename = self.minutes_filename(event)
         filepath = os.path.join(self.output_dir, filename)
         
-        # Skip if file already exists
+        headers = {}
         if os.path.exists(filepath):
-            print(f"Skipping existing file: {filename}")
-            return True
+            if not revalidate:
+                print(f"Skipping existing file: {filename}")
+                return True
+            # The server answers 304 Not Modified, with no body, if unchanged
+            headers['If-Modified-Since'] = formatdate(os.path.getmtime(filepath), usegmt=True)
         
         try:
-            response = requests.get(file_url, stream=True)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            with self.session.get(file_url, headers=headers, stream=True,
+                                  timeout=REQUEST_TIMEOUT) as response:
+                if response.status_code == 304:
+                    print(f"Skipping unchanged file: {filename}")
+                    return True
+                response.raise_for_status()
+                
+                # Write to a temporary file so a failed re-download keeps the
+                # old copy (main() never downloads the same file twice at once)
+                tmp_path = filepath + '.part'
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                    os.replace(tmp_path, filepath)
+                finally:
+                    # Only left behind if the download or write failed part way
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                
+                # Stamp the file with the server's modification time so later
+                # If-Modified-Since checks compare like with like
+                last_modified = response.headers.get('Last-Modified')
+                if last_modified:
+                    try:
+                        mtime = parsedate_to_datetime(last_modified).timestamp()
+                        os.utime(filepath, (mtime, mtime))
+                    except (TypeError, ValueError):
+                        pass
             return True
         except requests.exceptions.RequestException as e:
             print(f"Error downloading minutes for event {event['EventId']}: {e}")
@@ -80,6 +151,8 @@ def main():
     parser.add_argument('--end-date', type=valid_date,
                       default=datetime.now().strftime("%Y-%m-%d"),
                       help='End date in YYYY-MM-DD format (default: today)')
+    parser.add_argument('--revalidate', action='store_true',
+                      help='Re-download existing files if the minutes changed on the server')
     
     args = parser.parse_args()
     
@@ -94,11 +167,20 @@ def main():
     
     print(f"Found {len(events)} events")
     
-    # Download minutes for events that have them
+    # Download minutes for events that have them, overlapping requests
+    # across worker threads. Events that share a date and body save to the
+    # same file, so only the first of them is downloaded.
+    events_by_filename = {}
+    for event in events:
+        if event.get('EventMinutesFile'):
+            events_by_filename.setdefault(scraper.minutes_filename(event), event)
+    events_with_minutes = list(events_by_filename.values())
     successful_downloads = 0
-    for event in tqdm(events, desc="Downloading minutes"):
-        if scraper.download_minutes(event):
-            successful_downloads += 1
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        results = executor.map(scraper.download_minutes, events_with_minutes, repeat(args.revalidate))
+        for downloaded in tqdm(results, total=len(events_with_minutes), desc="Downloading minutes"):
+            if downloaded:
+                successful_downloads += 1
     
     print(f"\nSuccessfully downloaded {successful_downloads} minute files")
 
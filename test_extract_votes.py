@@ -0,0 +1,33 @@
+from extract_votes import _page_text
+
+
+class FakePage:
+    """Stand-in for a pdfplumber page: raw characters plus extract_text()."""
+
+    def __init__(self, chars, text):
+        self.chars = [{"text": char} for char in chars]
+        self.text = text
+        self.extract_text_calls = 0
+
+    def extract_text(self):
+        self.extract_text_calls += 1
+        return self.text
+
+
+def test_page_without_vote_keyword_is_skipped():
+    page = FakePage("Roll Call Present: 20", "Roll Call Present: 20")
+    assert _page_text(page) == ""
+    assert page.extract_text_calls == 0
+
+
+def test_keyword_split_across_chars_is_extracted():
+    # Raw characters carry kerning gaps and a line break inside the keyword
+    text = "Ayes: 18 - Alder One; Alder Two"
+    page = FakePage(["A", "y", " ", "e", "s", "\n", " :", " 18 - Alder One; Alder Two"], text)
+    assert _page_text(page) == text
+    assert page.extract_text_calls == 1
+
+
+def test_keyword_case_is_ignored():
+    page = FakePage(["A", "D", "O", "P", "T", " ", "final"], "ADOPT final")
+    assert _page_text(page) == "ADOPT final"